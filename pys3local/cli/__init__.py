@@ -0,0 +1,314 @@
+"""Command-line interface for pys3local."""
+
+import functools
+import importlib
+import re
+import sys
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import click
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Rich style tags used in CLI output, stripped when not writing to a terminal
+_MARKUP_RE = re.compile(
+    r"\[/?(?:bold|dim|red|green|yellow|cyan)(?: (?:bold|dim|red|green|yellow|cyan))*\]"
+)
+
+
+def _emit(message: str) -> None:
+    """Print a status line, rendering Rich markup only on a terminal.
+
+    When stdout is piped (e.g. under systemd) the markup is stripped and the
+    line is written with plain print(), skipping Rich's rendering.
+
+    Args:
+        message: Text with optional Rich markup (escape literal '[' as '\\[')
+    """
+    if sys.stdout.isatty():
+        _console().print(message)
+    else:
+        # Flush like Console.print so lines are not held back in a pipe
+        print(_MARKUP_RE.sub("", message).replace("\\[", "["), flush=True)
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommands only when they are dispatched.
+
+    ``lazy_subcommands`` maps a command name to the dotted import path of the
+    command object (``"package.module.attr"``). The module is imported the
+    first time the command is resolved, so invoking one subcommand never
+    builds the parsers of the others.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name]
+        modname, cmd_object_name = import_path.rsplit(".", 1)
+        mod = importlib.import_module(modname)
+        cmd_object = getattr(mod, cmd_object_name)
+        if not isinstance(cmd_object, click.Command):
+            raise TypeError(
+                f"Lazy loading of {import_path} failed by returning "
+                "a non-command object"
+            )
+        return cmd_object
+
+
+@click.group(
+    cls=LazyGroup,
+    invoke_without_command=True,
+    lazy_subcommands={
+        "serve": "pys3local.cli._serve.serve",
+        "obscure": "pys3local.cli._obscure.obscure",
+        "config": "pys3local.cli._config.config",
+    },
+)
+@click.pass_context
+@click.version_option(None, "-v", "--version", package_name="pys3local")
+def cli(ctx: click.Context) -> None:
+    """pys3local - Local S3 server for backup software.
+
+    Run 'pys3local serve' to start the server.
+    Run 'pys3local config' for configuration management.
+    """
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+
+
+@cli.group()
+def cache() -> None:
+    """Manage metadata cache for local storage backend.
+
+    The cache stores object metadata in SQLite for efficient access.
+    """
+
+
+@cache.command(name="stats")
+@click.option(
+    "--bucket",
+    type=str,
+    default=None,
+    help="Show stats for specific bucket (default: all buckets)",
+)
+def cache_stats(bucket: Optional[str]) -> None:
+    """Show cache statistics for local storage."""
+    from pys3local.metadata_db import MetadataDB
+
+    db = MetadataDB()
+
+    if bucket is None:
+        # Show stats for all buckets
+        buckets = db.list_local_buckets()
+
+        if not buckets:
+            _console().print("[yellow]Cache is empty[/yellow]")
+            return
+
+        _console().print("\n[bold cyan]Local Storage Cache Statistics[/bold cyan]\n")
+
+        # Overall stats
+        overall_stats = db.get_local_stats()
+        _console().print("[bold]Overall Statistics:[/bold]")
+        _console().print(f"  Total objects: {overall_stats['total_objects']:,}")
+        _console().print(f"  Total size: {_format_size(overall_stats['total_size'])}")
+
+        # Per-bucket stats
+        _console().print("\n[bold]Per-Bucket Statistics:[/bold]")
+        for bucket_name in buckets:
+            bucket_stats = db.get_local_stats(bucket_name)
+            _console().print(f"\n  {bucket_name}:")
+            _console().print(f"    Objects: {bucket_stats['total_objects']:,}")
+            _console().print(f"    Size: {_format_size(bucket_stats['total_size'])}")
+
+        _console().print()
+    else:
+        # Show stats for specific bucket
+        stats = db.get_local_stats(bucket)
+
+        if stats["total_objects"] == 0:
+            _console().print(f"[yellow]No cache entries for bucket '{bucket}'[/yellow]")
+            return
+
+        _console().print(
+            f"\n[bold cyan]Cache Statistics - Bucket '{bucket}'[/bold cyan]\n"
+        )
+        _console().print(f"Total objects: {stats['total_objects']:,}")
+        _console().print(f"Total size: {_format_size(stats['total_size'])}")
+        _console().print()
+
+
+@cache.command(name="cleanup")
+@click.option(
+    "--bucket",
+    type=str,
+    default=None,
+    help="Clean cache for specific bucket",
+)
+@click.option(
+    "--all",
+    "clean_all",
+    is_flag=True,
+    help="Clean entire cache (requires confirmation)",
+)
+def cache_cleanup(bucket: Optional[str], clean_all: bool) -> None:
+    """Clean cache entries for local storage.
+
+    Examples:
+      pys3local cache cleanup --bucket my-bucket
+      pys3local cache cleanup --all
+    """
+    from pys3local.metadata_db import MetadataDB
+
+    db = MetadataDB()
+
+    # Validate options
+    if not clean_all and bucket is None:
+        _console().print("[red]Error: Must specify --bucket or --all[/red]")
+        sys.exit(1)
+
+    if clean_all and bucket is not None:
+        _console().print("[red]Error: Cannot combine --all with --bucket[/red]")
+        sys.exit(1)
+
+    # Perform cleanup
+    if clean_all:
+        # Get stats before cleanup
+        stats = db.get_local_stats()
+        if stats["total_objects"] == 0:
+            _console().print("[yellow]Cache is already empty[/yellow]")
+            return
+
+        total = stats["total_objects"]
+        _console().print(
+            f"\n[bold yellow]Warning:[/bold yellow] This will remove "
+            f"{total:,} objects from the cache."
+        )
+        if not click.confirm("Are you sure?"):
+            _console().print("Aborted.")
+            return
+
+        # Clean all buckets
+        buckets = db.list_local_buckets()
+        total_removed = 0
+        for bucket_name in buckets:
+            removed = db.cleanup_local_bucket(bucket_name)
+            total_removed += removed
+
+        _console().print(
+            f"[green]✓[/green] Removed {total_removed:,} objects from cache"
+        )
+
+    elif bucket:
+        # Clean specific bucket
+        removed = db.cleanup_local_bucket(bucket)
+        if removed == 0:
+            _console().print(f"[yellow]No entries found for bucket '{bucket}'[/yellow]")
+        else:
+            _console().print(
+                f"[green]✓[/green] Removed {removed:,} objects for bucket '{bucket}'"
+            )
+
+
+@cache.command(name="vacuum")
+def cache_vacuum() -> None:
+    """Optimize database and reclaim unused space.
+
+    This should be run after large deletions to reduce database file size.
+    """
+    import os
+
+    from pys3local.metadata_db import MetadataDB
+
+    db = MetadataDB()
+
+    # Get size before vacuum
+    size_before = os.path.getsize(db.db_path) if db.db_path.exists() else 0
+
+    _console().print("Optimizing cache database...")
+    db.vacuum()
+
+    # Get size after vacuum
+    size_after = os.path.getsize(db.db_path) if db.db_path.exists() else 0
+
+    saved = size_before - size_after
+    _console().print("[green]✓[/green] Database optimized")
+    _console().print(f"  Before: {_format_size(size_before)}")
+    _console().print(f"  After: {_format_size(size_after)}")
+    if saved > 0:
+        _console().print(f"  Saved: {_format_size(saved)}")
+
+
+def _format_size(size_bytes: Union[int, str, None]) -> str:
+    """Format size in bytes to human-readable format.
+
+    Args:
+        size_bytes: Size in bytes (None will be treated as 0)
+
+    Returns:
+        Human-readable size string
+    """
+    if size_bytes is None:
+        return "0 B"
+    # Convert to int first (handles both int and str)
+    size_int = int(size_bytes) if isinstance(size_bytes, str) else size_bytes
+    size: float = float(size_int)
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} PB"
+
+
+def _print_version() -> bool:
+    """Print the installed version without building the Click parser.
+
+    Returns:
+        True if the version was printed, False if it could not be determined
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        package_version = version("pys3local")
+    except PackageNotFoundError:
+        return False
+    # Same format as click.version_option
+    print(f"pys3local, version {package_version}")
+    return True
+
+
+def main() -> None:
+    """Entry point for the CLI."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version") and _print_version():
+        return
+    cli()
+
+
+if __name__ == "__main__":
+    main()
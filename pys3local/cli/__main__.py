@@ -0,0 +1,5 @@
+"""Allow running the CLI with ``python -m pys3local.cli``."""
+
+from pys3local.cli import main
+
+main()
@@ -0,0 +1,139 @@
+"""The ``config`` command: interactive backend configuration."""
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import click
+
+from pys3local.cli import _console
+
+if TYPE_CHECKING:
+    from pys3local.config import Pys3localConfigManager
+
+# Backend config keys whose values are never displayed
+_HIDDEN_KEYS: frozenset[str] = frozenset({"api_key", "password", "secret_access_key"})
+
+_MENU = (
+    "[bold]Available commands:[/bold]\n"
+    "  1. List backends\n"
+    "  2. Add backend\n"
+    "  3. Show backend\n"
+    "  4. Remove backend\n"
+    "  5. Exit"
+)
+
+
+def _list(config_manager: "Pys3localConfigManager") -> bool:
+    """List configured backends."""
+    backends = config_manager.list_backends()
+    if not backends:
+        _console().print("\n[yellow]No backends configured[/yellow]\n")
+    else:
+        _console().print("\n[bold]Configured backends:[/bold]")
+        for name in backends:
+            backend = config_manager.get_backend(name)
+            if backend:
+                _console().print(f"  • {name} ({backend.backend_type})")
+        _console().print()
+    return True
+
+
+def _add(config_manager: "Pys3localConfigManager") -> bool:
+    """Prompt for a new backend and store it."""
+    _console().print("\n[bold]Add new backend[/bold]")
+    name = click.prompt("Backend name")
+    backend_type = click.prompt("Backend type", type=click.Choice(["local", "drime"]))
+
+    config_data: dict[str, Any] = {}
+
+    if backend_type == "local":
+        path = click.prompt("Base path")
+        config_data["path"] = path
+
+    elif backend_type == "drime":
+        api_key = click.prompt("Drime API key", hide_input=True)
+        workspace_id = click.prompt(
+            "Workspace ID (0 for personal)", type=int, default=0
+        )
+        root_folder = click.prompt(
+            "Root folder (optional - limit S3 scope to specific folder)",
+            default="",
+            show_default=False,
+        )
+        config_data["api_key"] = api_key
+        config_data["workspace_id"] = workspace_id
+        if root_folder:
+            config_data["root_folder"] = root_folder
+
+    config_manager.add_backend(name, backend_type, config_data)
+    _console().print(f"\n[green]✓[/green] Backend '{name}' added successfully\n")
+    return True
+
+
+def _show(config_manager: "Pys3localConfigManager") -> bool:
+    """Show a backend's configuration with secrets hidden."""
+    name = click.prompt("\nBackend name")
+    backend = config_manager.get_backend(name)
+
+    if not backend:
+        _console().print(f"\n[red]Error:[/red] Backend '{name}' not found\n")
+        return True
+
+    _console().print(f"\n[bold]Backend: {name}[/bold]")
+    _console().print(f"Type: {backend.backend_type}")
+    _console().print("\nConfiguration:")
+    config_data = backend.get_all()
+    for key, value in config_data.items():
+        if key in _HIDDEN_KEYS:
+            _console().print(f"  {key}: [dim]<hidden>[/dim]")
+        else:
+            _console().print(f"  {key}: {value}")
+    _console().print()
+    return True
+
+
+def _remove(config_manager: "Pys3localConfigManager") -> bool:
+    """Remove a backend after confirmation."""
+    name = click.prompt("\nBackend name")
+    if config_manager.has_backend(name):
+        if click.confirm(f"Remove backend '{name}'?"):
+            config_manager.remove_backend(name)
+            _console().print(f"\n[green]✓[/green] Backend '{name}' removed\n")
+    else:
+        _console().print(f"\n[red]Error:[/red] Backend '{name}' not found\n")
+    return True
+
+
+def _exit(config_manager: "Pys3localConfigManager") -> bool:
+    """Leave the configuration session."""
+    _console().print("\nExiting configuration manager.\n")
+    return False
+
+
+# Menu choice -> action; an action returns False to end the session
+_ACTIONS: dict[int, Callable[["Pys3localConfigManager"], bool]] = {
+    1: _list,
+    2: _add,
+    3: _show,
+    4: _remove,
+    5: _exit,
+}
+
+
+@click.command()
+def config() -> None:
+    """Enter an interactive configuration session."""
+    from pys3local.config import get_config_manager
+
+    config_manager = get_config_manager()
+
+    _console().print("\n[bold cyan]pys3local Configuration Manager[/bold cyan]\n")
+
+    keep_going = True
+    while keep_going:
+        _console().print(_MENU)
+
+        choice = click.prompt("\nEnter choice", type=int, default=5)
+
+        action = _ACTIONS.get(choice)
+        if action is not None:
+            keep_going = action(config_manager)
@@ -0,0 +1,39 @@
+"""The ``obscure`` command: obscure a password for the config file."""
+
+import functools
+import sys
+from typing import Callable, Optional
+
+import click
+
+from pys3local.cli import _console
+
+
+@functools.lru_cache(maxsize=1)
+def _vaultconfig_obscure() -> Callable[[str], str]:
+    """Import vaultconfig's obscure function on first use."""
+    from vaultconfig import obscure as obscure_module  # type: ignore[import-not-found]
+
+    return obscure_module.obscure  # type: ignore[no-any-return]
+
+
+@click.command()
+@click.argument("password", required=False)
+def obscure(password: Optional[str]) -> None:
+    """Obscure a password for use in the pys3local config file.
+
+    If PASSWORD is not provided, will prompt for it interactively.
+    """
+    if password is None:
+        password = click.prompt("Enter password to obscure", hide_input=True)
+
+    if not password:
+        _console().print("[red]Error: Password cannot be empty[/red]")
+        sys.exit(1)
+
+    obscured = _vaultconfig_obscure()(password)
+    _console().print(f"\n[green]Obscured password:[/green] {obscured}")
+    _console().print("\n[yellow]Note:[/yellow] This can be used in the config file.")
+    _console().print(
+        "The password will be automatically revealed when the config is loaded."
+    )
@@ -0,0 +1,411 @@
+"""The ``serve`` command: run the S3-compatible server."""
+
+import functools
+import logging
+import os
+import signal
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+import click
+
+from pys3local import constants
+from pys3local.cli import _console, _emit
+
+logger = logging.getLogger(__name__)
+
+
+def signal_handler(signum, frame):
+    """Handle Ctrl+C gracefully."""
+    _emit("\n[yellow]Server stopped by user[/yellow]")
+    sys.exit(0)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_path() -> str:
+    """Return the default local data directory (<tempdir>/s3store)."""
+    import tempfile
+
+    return str(Path(tempfile.gettempdir()) / "s3store")
+
+
+@click.command()
+@click.option(
+    "--path",
+    default=_default_path,
+    help="Data directory (default: /tmp/s3store)",
+)
+@click.option(
+    "--listen",
+    default=f":{constants.DEFAULT_PORT}",
+    help=f"Listen address (default: :{constants.DEFAULT_PORT})",
+)
+@click.option(
+    "--access-key-id",
+    default=constants.DEFAULT_ACCESS_KEY,
+    help=f"AWS access key ID (default: {constants.DEFAULT_ACCESS_KEY})",
+)
+@click.option(
+    "--secret-access-key",
+    default=constants.DEFAULT_SECRET_KEY,
+    help=f"AWS secret access key (default: {constants.DEFAULT_SECRET_KEY})",
+)
+@click.option(
+    "--region",
+    default=constants.DEFAULT_REGION,
+    help=f"AWS region (default: {constants.DEFAULT_REGION})",
+)
+@click.option(
+    "--no-auth",
+    is_flag=True,
+    help="Disable authentication",
+)
+@click.option(
+    "--debug",
+    is_flag=True,
+    help="Enable debug logging",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(["local", "drime"]),
+    default="local",
+    help="Storage backend (default: local)",
+)
+@click.option(
+    "--backend-config",
+    default=None,
+    help="Backend configuration name (from ~/.config/pys3local/backends.toml)",
+)
+@click.option(
+    "--root-folder",
+    default=None,
+    help="Root folder path for Drime backend (e.g., 'backups/s3')",
+)
+@click.option(
+    "--allow-bucket-creation",
+    is_flag=True,
+    help="Allow creation of custom buckets (default: only 'default' bucket allowed)",
+)
+def serve(
+    path: str,
+    listen: str,
+    access_key_id: str,
+    secret_access_key: str,
+    region: str,
+    no_auth: bool,
+    debug: bool,
+    backend: str,
+    backend_config: Optional[str],
+    root_folder: Optional[str],
+    allow_bucket_creation: bool,
+) -> None:
+    """Start the S3-compatible server."""
+    host, port = _parse_listen(listen)
+
+    if backend not in ("local", "drime"):
+        _emit(f"[red]Unknown backend: {backend}[/red]")
+        sys.exit(1)
+
+    import uvicorn
+    from rich.logging import RichHandler
+
+    # Setup logging once the arguments are known to be valid
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format="%(message)s",
+        handlers=[
+            RichHandler(console=_console(), rich_tracebacks=True, show_time=False)
+        ],
+    )
+
+    # Create storage provider based on backend
+    if backend == "local":
+        from pys3local.providers.local import LocalStorageProvider
+
+        _emit(f"Data directory: {path}")
+
+        provider = LocalStorageProvider(base_path=Path(path), readonly=False)
+
+    else:
+        provider, config_info = _create_drime_provider(
+            backend_config, False, root_folder
+        )
+        _emit("Storage backend: Drime Cloud")
+        _emit(f"Workspace ID: {config_info.get('workspace_id', 0)}")
+        if backend_config:
+            _emit(f"Configuration: {backend_config}")
+        if root_folder:
+            _emit(f"Root Folder: {root_folder}")
+
+    # Display authentication status
+    auth_lines = (
+        (
+            "[yellow]Authentication disabled[/yellow]",
+            "[dim]Note: Clients can use any credentials when auth is disabled[/dim]",
+        )
+        if no_auth
+        else (
+            "[green]Authentication enabled[/green]",
+            f"Access Key ID: [cyan]{access_key_id}[/cyan]",
+            f"Secret Access Key: [cyan]{secret_access_key}[/cyan]",
+            f"Region: [cyan]{region}[/cyan]",
+        )
+    )
+    _emit("\n".join(auth_lines))
+
+    # Display bucket mode
+    if allow_bucket_creation:
+        _emit("[yellow]Bucket mode: Advanced (custom buckets allowed)[/yellow]")
+        _emit("[dim]Buckets will be created as directories in storage[/dim]")
+    else:
+        _emit("[green]Bucket mode: Default (virtual 'default' bucket)[/green]")
+        _emit(
+            "[dim]Only 'default' bucket is available "
+            "(use --allow-bucket-creation for custom buckets)[/dim]"
+        )
+
+    # Create and run server
+    try:
+        from pys3local.server import create_s3_app
+
+        app = create_s3_app(
+            provider=provider,
+            access_key=access_key_id,
+            secret_key=secret_access_key,
+            region=region,
+            no_auth=no_auth,
+            allow_bucket_creation=allow_bucket_creation,
+        )
+
+        _emit(f"\n[green]Starting S3 server at http://{host}:{port}/[/green]")
+
+        # Show rclone configuration example
+        if not no_auth:
+            _emit("\n[bold]rclone configuration:[/bold]")
+            _emit("[dim]Add this to ~/.config/rclone/rclone.conf:[/dim]")
+            _emit("")
+            _emit("\\[pys3local]")
+            _emit("type = s3")
+            _emit("provider = Other")
+            _emit(f"access_key_id = {access_key_id}")
+            _emit(f"secret_access_key = {secret_access_key}")
+            _emit(
+                f"endpoint = http://{host if host != '0.0.0.0' else 'localhost'}:{port}"
+            )
+            _emit(f"region = {region}")
+            _emit("")
+            _emit("[dim]# Test the connection:[/dim]")
+            _emit("[dim]rclone lsd pys3local:  # Should show 'default' bucket[/dim]")
+            _emit(
+                "[dim]rclone ls pys3local:default/  "
+                "# List files in default bucket[/dim]"
+            )
+            _emit("")
+        else:
+            _emit("\n[bold]rclone configuration:[/bold]")
+            _emit("[dim]Add this to ~/.config/rclone/rclone.conf:[/dim]")
+            _emit("")
+            _emit("\\[pys3local]")
+            _emit("type = s3")
+            _emit("provider = Other")
+            _emit("access_key_id = test")
+            _emit("secret_access_key = test")
+            _emit(
+                f"endpoint = http://{host if host != '0.0.0.0' else 'localhost'}:{port}"
+            )
+            _emit(f"region = {region}")
+            _emit("")
+            _emit("[dim]# Test the connection:[/dim]")
+            _emit("[dim]rclone lsd pys3local:  # Should show 'default' bucket[/dim]")
+            _emit(
+                "[dim]rclone ls pys3local:default/  "
+                "# List files in default bucket[/dim]"
+            )
+            _emit("")
+
+        _emit("[dim]Press Ctrl+C to stop the server[/dim]\n")
+
+        # Set up signal handler for graceful shutdown
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+
+        # Configure uvicorn for better compatibility with S3 clients like rclone
+        loop, http = _select_uvicorn_backends()
+        try:
+            uvicorn.run(
+                app,
+                host=host,
+                port=port,
+                log_level="error" if not debug else "info",
+                loop=loop,
+                http=http,
+                interface="asgi3",
+                server_header=False,  # Don't send Server header for compatibility
+                timeout_keep_alive=75,  # Standard keep-alive timeout
+                access_log=debug,  # Only show access log in debug mode
+            )
+        except KeyboardInterrupt:
+            _emit("\n[yellow]Server stopped by user[/yellow]")
+            sys.exit(0)
+        finally:
+            provider.close()
+
+    except Exception as e:
+        _emit(f"[red]Error: {e}[/red]")
+        logger.exception("Server error")
+        sys.exit(1)
+
+
+def _parse_listen(listen: str) -> tuple[str, int]:
+    """Split a listen address into host and port.
+
+    Args:
+        listen: Address as ":port", "host:port" or "host"
+
+    Returns:
+        Tuple of (host, port); the host defaults to 0.0.0.0 and the port to
+        DEFAULT_PORT
+    """
+    host_part, sep, port_part = listen.rpartition(":")
+    if sep:
+        return host_part or "0.0.0.0", int(port_part)
+    return port_part, constants.DEFAULT_PORT
+
+
+def _select_uvicorn_backends() -> tuple[str, str]:
+    """Pick the fastest available uvicorn event loop and HTTP parser.
+
+    uvloop and httptools ship with ``uvicorn[standard]`` but are not
+    available on every platform (e.g. uvloop on Windows), so fall back to
+    asyncio and h11 when they cannot be imported.
+
+    Returns:
+        Tuple of (loop, http) implementation names for uvicorn.run
+    """
+    from importlib.util import find_spec
+
+    loop = "uvloop"
+    if find_spec("uvloop") is None:
+        logger.warning("uvloop is not installed, falling back to asyncio loop")
+        loop = "asyncio"
+
+    http = "httptools"
+    if find_spec("httptools") is None:
+        logger.warning("httptools is not installed, falling back to h11 parser")
+        http = "h11"
+
+    return loop, http
+
+
+@functools.lru_cache(maxsize=1)
+def _load_drime() -> tuple[Any, Any]:
+    """Import the Drime client and storage provider classes once.
+
+    Returns:
+        Tuple of (DrimeClient class, DrimeStorageProvider class)
+
+    Raises:
+        ImportError: If pydrime is not installed
+    """
+    from pydrime import DrimeClient  # type: ignore[import-not-found]
+
+    from pys3local.providers.drime import DrimeStorageProvider
+
+    return DrimeClient, DrimeStorageProvider
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_drime_client(api_key: str) -> Any:
+    """Create a Drime client, reusing an existing one for the same API key.
+
+    Args:
+        api_key: Drime API key (empty to let pydrime read its own config)
+
+    Returns:
+        DrimeClient instance
+    """
+    DrimeClient, _ = _load_drime()
+    return DrimeClient(api_key=api_key or None)
+
+
+def _create_drime_provider(
+    backend_config_name: Optional[str],
+    readonly: bool,
+    root_folder: Optional[str] = None,
+) -> tuple[Any, dict[str, Any]]:
+    """Create a Drime storage provider.
+
+    Args:
+        backend_config_name: Name of backend config to use
+        readonly: Whether to enable readonly mode
+        root_folder: Optional root folder path in Drime
+
+    Returns:
+        Tuple of (DrimeStorageProvider instance, config dict)
+    """
+    try:
+        _, DrimeStorageProvider = _load_drime()
+    except ImportError:
+        _emit("[red]Drime backend requires pydrime package.[/red]")
+        _emit("Install with: pip install pys3local[drime]")
+        sys.exit(1)
+
+    config: dict[str, Any] = {}
+
+    # Load config from backend config if provided
+    if backend_config_name:
+        from pys3local.config import get_config_manager
+
+        config_manager = get_config_manager()
+        backend_cfg = config_manager.get_backend(backend_config_name)
+
+        if not backend_cfg:
+            _emit(f"[red]Backend config '{backend_config_name}' not found.[/red]")
+            _emit("Available backends:")
+            for name in config_manager.list_backends():
+                _emit(f"  - {name}")
+            sys.exit(1)
+
+        if backend_cfg.backend_type != "drime":
+            _emit(f"[red]Backend '{backend_config_name}' is not a drime backend.[/red]")
+            sys.exit(1)
+
+        config = backend_cfg.get_all()
+
+        try:
+            api_key = config.get("api_key")
+
+            if not api_key:
+                _emit("[red]Drime backend config must include 'api_key'.[/red]")
+                sys.exit(1)
+
+            client = _cached_drime_client(api_key)
+        except Exception as e:
+            _emit(f"[red]Failed to initialize Drime client: {e}[/red]")
+            sys.exit(1)
+    else:
+        # Initialize from environment
+        try:
+            client = _cached_drime_client(os.environ.get("DRIME_API_KEY", ""))
+            config["workspace_id"] = (
+                int(os.environ["DRIME_WORKSPACE_ID"])
+                if "DRIME_WORKSPACE_ID" in os.environ
+                else 0
+            )
+        except Exception as e:
+            _emit(f"[red]Failed to initialize Drime client: {e}[/red]")
+            _emit("\nMake sure DRIME_API_KEY environment variable is set.")
+            _emit("Or use --backend-config to specify a backend config.")
+            sys.exit(1)
+
+    # Get root_folder from CLI parameter or backend config
+    effective_root_folder = root_folder or config.get("root_folder")
+
+    provider = DrimeStorageProvider(
+        client=client,
+        workspace_id=config.get("workspace_id", 0),
+        readonly=readonly,
+        root_folder=effective_root_folder,
+    )
+    return provider, config
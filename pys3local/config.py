@@ -5,6 +5,7 @@ This module provides configuration management for pys3local backend configuratio
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any, Literal
 
@@ -102,20 +103,59 @@ class Pys3localConfigManager:
         self.config_file = config_file
         self._config_dir = config_file.parent
 
+        # Parsed BackendConfig objects, valid while the name, mtime and size
+        # of every backend file match _loaded_state (so adding, removing or
+        # editing a backend file in place all drop the cache)
+        self._backend_cache: dict[str, BackendConfig | None] = {}
+        self._loaded_state = self._config_files_state()
+
         # Use vaultconfig ConfigManager
-        self._manager = ConfigManager(
+        self._manager = self._create_manager()
+
+    def _create_manager(self) -> ConfigManager:
+        """Create a vaultconfig ConfigManager, loading all config files."""
+        return ConfigManager(
             config_dir=self._config_dir,
             format="toml",
             password=None,
             obscurer=_PYS3LOCAL_OBSCURER,
         )
 
+    def _config_files_state(self) -> tuple[tuple[str, int, int], ...]:
+        """Return (name, mtime in ns, size) for each backend file, sorted."""
+        try:
+            entries = list(os.scandir(self._config_dir))
+        except OSError:
+            return ()
+        state = []
+        for entry in entries:
+            if not entry.name.endswith(".toml"):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            state.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(state))
+
+    def _refresh(self) -> None:
+        """Reload configs from disk if any backend file changed."""
+        if self._config_files_state() != self._loaded_state:
+            self._manager = self._create_manager()
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop cached backend configs and mark the on-disk state as loaded."""
+        self._backend_cache.clear()
+        self._loaded_state = self._config_files_state()
+
     def list_backends(self) -> list[str]:
         """List all backend names.
 
         Returns:
             List of backend names
         """
+        self._refresh()
         result: list[str] = self._manager.list_configs()
         return result
 
@@ -128,15 +168,20 @@ class Pys3localConfigManager:
         Returns:
             BackendConfig or None if not found
         """
-        config_entry = self._manager.get_config(name)
-        if not config_entry:
-            return None
+        self._refresh()
+        if name in self._backend_cache:
+            return self._backend_cache[name]
 
-        # Extract backend type and config
-        data = config_entry.get_all(reveal_secrets=False)
-        backend_type = data.pop("type", "local")
+        backend: BackendConfig | None = None
+        config_entry = self._manager.get_config(name)
+        if config_entry:
+            # Extract backend type and config
+            data = config_entry.get_all(reveal_secrets=False)
+            backend_type = data.pop("type", "local")
+            backend = BackendConfig(name, backend_type, data)
 
-        return BackendConfig(name, backend_type, data)
+        self._backend_cache[name] = backend
+        return backend
 
     def has_backend(self, name: str) -> bool:
         """Check if backend exists.
@@ -147,6 +192,7 @@ class Pys3localConfigManager:
         Returns:
             True if backend exists
         """
+        self._refresh()
         result: bool = self._manager.has_config(name)
         return result
 
@@ -176,7 +222,9 @@ class Pys3localConfigManager:
                     if not _PYS3LOCAL_OBSCURER.is_obscured(full_config[key]):
                         full_config[key] = _PYS3LOCAL_OBSCURER.obscure(full_config[key])
 
+        self._refresh()
         self._manager.add_config(name, full_config, obscure_passwords=False)
+        self.invalidate()
 
     def remove_backend(self, name: str) -> bool:
         """Remove backend.
@@ -187,7 +235,9 @@ class Pys3localConfigManager:
         Returns:
             True if removed
         """
+        self._refresh()
         result: bool = self._manager.remove_config(name)
+        self.invalidate()
         return result
 
     def get_backend_names_by_type(self, backend_type: BackendType) -> list[str]:
@@ -252,3 +252,10 @@ class StorageProvider(ABC):
             True if read-only mode is enabled
         """
         pass
+
+    def close(self) -> None:
+        """Release resources such as background threads held by the provider.
+
+        The default implementation does nothing.
+        """
+        return
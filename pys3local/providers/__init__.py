@@ -1,14 +1,28 @@
-"""Storage providers for pys3local."""
+"""Storage providers for pys3local.
 
-from __future__ import annotations
+Provider classes are imported on first access so that using one backend does
+not load the others.
+"""
 
-from pys3local.providers.local import LocalStorageProvider
+from __future__ import annotations
 
-__all__ = ["LocalStorageProvider"]
+import importlib
+from typing import TYPE_CHECKING, Any
 
-try:
+if TYPE_CHECKING:
     from pys3local.providers.drime import DrimeStorageProvider
+    from pys3local.providers.local import LocalStorageProvider
+
+__all__ = ["DrimeStorageProvider", "LocalStorageProvider"]
+
+_PROVIDER_MODULES = {
+    "LocalStorageProvider": "pys3local.providers.local",
+    "DrimeStorageProvider": "pys3local.providers.drime",
+}
+
 
-    __all__.append("DrimeStorageProvider")
-except ImportError:
-    pass
+def __getattr__(name: str) -> Any:
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
+import os
+import shutil
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
 
 from pys3local.errors import (
     BucketAlreadyExists,
@@ -18,12 +27,250 @@ from pys3local.errors import (
 from pys3local.models import Bucket, S3Object
 from pys3local.provider import StorageProvider
 
+try:
+    from pydrime.models import (  # type: ignore[import-not-found]
+        FileEntriesResult,
+        FileEntry,
+    )
+except ImportError:  # pydrime is only installed with the "drime" extra
+    FileEntriesResult = FileEntry = None
+
 if TYPE_CHECKING:
     from pydrime.api import DrimeClient  # type: ignore[import-not-found]
-    from pydrime.models import FileEntry  # type: ignore[import-not-found]
 
 logger = logging.getLogger(__name__)
 
+# Default number of seconds a cached folder lookup (hit or miss) is trusted
+DEFAULT_CACHE_TTL = 60.0
+
+# A folder lookup older than cache_ttl is still served, while it is refreshed
+# in the background, until it is this many times older than cache_ttl
+_CACHE_STALE_FACTOR = 5
+
+# Default number of seconds cached object metadata (HEAD results) is trusted
+DEFAULT_OBJECT_CACHE_TTL = 5.0
+
+# Maximum number of entries kept in the folder, directory and object caches
+_FOLDER_CACHE_MAXSIZE = 10_000
+_DIR_INDEX_MAXSIZE = 512
+_OBJECT_CACHE_MAXSIZE = 4096
+
+# Default number of Drime API requests issued in parallel
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Number of entries requested per page of a Drime listing
+_PAGE_SIZE = 1000
+
+# Marker for "path not in the folder cache" (None means cached as missing)
+_MISSING: Any = object()
+
+# RAM-backed directory preferred for staging uploads
+_SHM_DIR = "/dev/shm"
+
+# pydrime's general ISO parser, imported on first use
+_PARSE_ISO: Callable[[str], datetime | None] | None = None
+
+
+def _parse_iso_fallback(value: str) -> datetime | None:
+    """Parse a timestamp that datetime.fromisoformat() rejected.
+
+    Args:
+        value: Timestamp string
+
+    Returns:
+        Parsed datetime, or None if pydrime cannot parse it either
+    """
+    global _PARSE_ISO
+    if _PARSE_ISO is None:
+        from pydrime.utils import (  # type: ignore[import-not-found]
+            parse_iso_timestamp,
+        )
+
+        _PARSE_ISO = parse_iso_timestamp
+    return _PARSE_ISO(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_cached(value: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp into a naive UTC datetime.
+
+    Listings of bulk-uploaded files repeat the same timestamps, so results
+    are memoized per string; datetimes are immutable and safe to share.
+
+    Args:
+        value: Timestamp string from the Drime API
+
+    Returns:
+        Naive UTC datetime, or None if the string cannot be parsed
+    """
+    # Drime sends ISO 8601 strings, which the C-implemented fromisoformat()
+    # handles directly; older Pythons reject the "Z" suffix, so spell it as
+    # an offset
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        # Unusual formats go through pydrime's more lenient parser
+        try:
+            parsed = _parse_iso_fallback(value)
+        except (ValueError, AttributeError, ImportError) as e:
+            logger.warning("Failed to parse datetime '%s': %s", value, e)
+            return None
+        if parsed is None:
+            return None
+
+    if parsed.tzinfo is not None:
+        # Has timezone, convert to UTC and make naive
+        return parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    # Already naive, assume it's UTC
+    return parsed
+
+
+def _is_api_status(error: Exception, *codes: int) -> bool:
+    """Tell whether a Drime client error stands for one of some HTTP statuses.
+
+    pydrime raises dedicated exception types for 403 and 404 and names the
+    status code in the message of other errors.
+
+    Args:
+        error: Exception raised by the Drime client
+        *codes: HTTP status codes to check for
+
+    Returns:
+        True if the error matches one of the status codes
+    """
+    from pydrime.exceptions import (  # type: ignore[import-not-found]
+        DrimeNotFoundError,
+        DrimePermissionError,
+    )
+
+    by_type: dict[int, type[Exception]] = {
+        403: DrimePermissionError,
+        404: DrimeNotFoundError,
+    }
+    return any(
+        isinstance(error, by_type.get(code, ())) or str(code) in str(error)
+        for code in codes
+    )
+
+
+def _upload_staging_dir(size: int) -> str | None:
+    """Pick the directory used to stage an upload of ``size`` bytes.
+
+    Args:
+        size: Payload size in bytes
+
+    Returns:
+        /dev/shm if it is writable and has room for the payload, otherwise
+        None for the default temporary directory
+    """
+    try:
+        # Keep headroom so concurrent uploads cannot exhaust shared memory
+        if os.access(_SHM_DIR, os.W_OK) and shutil.disk_usage(_SHM_DIR).free > 2 * size:
+            return _SHM_DIR
+    except OSError:
+        pass
+    return None
+
+
+def _write_staging_file(data: bytes, filename: str) -> Path:
+    """Write upload data to a private temporary file named ``filename``.
+
+    pydrime only uploads from a path and takes the remote name from it, so
+    the file keeps the object's name inside a unique temporary directory.
+
+    Args:
+        data: Object data
+        filename: Name of the file to create
+
+    Returns:
+        Path of the written file
+    """
+    staging_dir = Path(
+        tempfile.mkdtemp(prefix="pys3local-", dir=_upload_staging_dir(len(data)))
+    )
+    tmp_path = staging_dir / filename
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+    except BaseException:
+        _remove_staging_file(tmp_path)
+        raise
+    return tmp_path
+
+
+def _remove_staging_file(tmp_path: Path) -> None:
+    """Remove a file created by _write_staging_file and its directory."""
+    tmp_path.unlink(missing_ok=True)
+    try:
+        tmp_path.parent.rmdir()
+    except OSError:
+        pass
+
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+def _next_prefix_end(path: str, end: int) -> int:
+    """Return where the prefix of path one component longer than path[:end] ends.
+
+    Args:
+        path: Folder path with "/" separators
+        end: End of the current prefix (0 for none)
+
+    Returns:
+        Index of the next "/" after the prefix, or len(path) at the last part
+    """
+    next_end = path.find("/", end + 1 if end else 0)
+    return len(path) if next_end == -1 else next_end
+
+
+class _LRUCache(OrderedDict[_K, _V]):
+    """Dictionary bounded to ``maxsize`` entries, evicting the least recently used.
+
+    Reads through get() and all writes mark an entry as recently used. The
+    operations used by the provider take ``lock``, since directory listings are
+    fetched from worker threads.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+        self.lock = threading.RLock()
+
+    def get(self, key: _K, default: Any = None) -> Any:
+        with self.lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return self[key]
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        with self.lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def pop(self, key: _K, *default: Any) -> Any:
+        with self.lock:
+            return super().pop(key, *default)
+
+    def clear(self) -> None:
+        with self.lock:
+            super().clear()
+
+    def discard_where(self, predicate: Callable[[_K], bool]) -> None:
+        """Remove every entry whose key matches ``predicate``."""
+        with self.lock:
+            for key in [k for k in self if predicate(k)]:
+                del self[key]
+
 
 class DrimeStorageProvider(StorageProvider):
     """Drime Cloud storage provider.
@@ -39,6 +286,9 @@ class DrimeStorageProvider(StorageProvider):
         workspace_id: int = 0,
         readonly: bool = False,
         root_folder: str | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        object_cache_ttl: float = DEFAULT_OBJECT_CACHE_TTL,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """Initialize Drime storage provider.
 
@@ -50,71 +300,103 @@ class DrimeStorageProvider(StorageProvider):
                         (e.g., "backups" or "backups/s3"). If specified, all
                         S3 buckets will be created within this folder instead
                         of at the workspace root.
+            cache_ttl: Seconds a cached folder lookup is trusted before the
+                        Drime API is queried again
+            object_cache_ttl: Seconds cached object metadata is reused by
+                        head_object
+            max_concurrency: Maximum number of Drime API requests issued in
+                        parallel for bulk operations
         """
+        if FileEntriesResult is None:
+            raise ImportError(
+                "pydrime is required for the Drime provider; install pys3local[drime]"
+            )
+
         self.client = client
         self.workspace_id = workspace_id
         self.readonly = readonly
         self.root_folder = root_folder
         self._root_folder_id: int | None = None
-        # Cache for folder IDs to reduce API calls
-        self._folder_cache: dict[str, int | None] = {}
+        # Cache of folder path -> (folder ID, fetch time, refresh pending) to
+        # reduce API calls. A folder ID of None records a missing path.
+        self._folder_cache: _LRUCache[str, tuple[int | None, float, bool]] = _LRUCache(
+            _FOLDER_CACHE_MAXSIZE
+        )
+        # Created on first use for refreshing stale folder lookups
+        self._refresher: ThreadPoolExecutor | None = None
+        # Index of folder ID -> (fetch time, {folder name: FileEntry},
+        # {file name: FileEntry})
+        self._dir_index: _LRUCache[
+            int | None,
+            tuple[float, dict[str, FileEntry], dict[str, FileEntry]],
+        ] = _LRUCache(_DIR_INDEX_MAXSIZE)
+        # Every folder of the workspace as (parent ID, name) -> folder ID,
+        # fetched with a single request; None until loaded or after changes
+        self._folder_tree: dict[tuple[int | None, str], int] | None = None
+        self._folder_tree_at = 0.0
+        self._folder_tree_lock = threading.Lock()
+        # Cleared if the account cannot list its folders in one request
+        self._folder_tree_supported = True
+        # ID of the logged-in user, fetched once for the folder tree request
+        self._user_id: int | None = None
+        self._cache_ttl = cache_ttl
+        # Cache of (bucket, key) -> (fetch time, S3Object) for head_object
+        self._object_meta_cache: _LRUCache[tuple[str, str], tuple[float, S3Object]] = (
+            _LRUCache(_OBJECT_CACHE_MAXSIZE)
+        )
+        self._object_cache_ttl = object_cache_ttl
+        self._max_concurrency = max(1, max_concurrency)
+        # Cleared once the API rejects server-side copies
+        self._supports_server_copy = True
 
         # Initialize root folder if specified
         if root_folder:
             self._root_folder_id = self._get_folder_id_by_path(root_folder)
             if self._root_folder_id is None and not readonly:
                 # Create the root folder structure if it doesn't exist
-                logger.info(f"Creating root folder: {root_folder}")
+                logger.info("Creating root folder: %s", root_folder)
                 self._root_folder_id = self._get_folder_id_by_path(
                     root_folder, create=True
                 )
+            # Paths above were resolved from the workspace root; drop them so
+            # they are not confused with bucket paths relative to root_folder
+            self._folder_cache.clear()
             logger.info(
-                f"Drime storage initialized (workspace {workspace_id}, "
-                f"root_folder: {root_folder})"
+                "Drime storage initialized (workspace %s, root_folder: %s)",
+                workspace_id,
+                root_folder,
             )
         else:
-            logger.info(f"Drime storage initialized (workspace {workspace_id})")
+            logger.info("Drime storage initialized (workspace %s)", workspace_id)
 
-    def _parse_datetime(self, dt_value: datetime | str | None) -> datetime:
+    def _parse_datetime(
+        self, dt_value: datetime | str | None, now: datetime | None = None
+    ) -> datetime:
         """Parse datetime value from pydrime (can be datetime or ISO string).
 
         Args:
             dt_value: Datetime object, ISO format string, or None
+            now: Naive UTC fallback for missing or invalid values; callers
+                 parsing many entries pass it in so the clock is read once
 
         Returns:
             Naive datetime object in UTC (for XML template compatibility)
         """
-        if dt_value is None:
-            return datetime.now(timezone.utc).replace(tzinfo=None)
-
-        if isinstance(dt_value, datetime):
-            # Convert to naive UTC datetime
+        # Strings are by far the most common value, so they are checked first
+        if isinstance(dt_value, str):
+            parsed = _parse_iso_cached(dt_value)
+            if parsed is not None:
+                return parsed
+        elif isinstance(dt_value, datetime):
             if dt_value.tzinfo is not None:
                 # Convert to UTC and remove timezone info
                 return dt_value.astimezone(timezone.utc).replace(tzinfo=None)
             # Already naive, assume it's UTC
             return dt_value
+        elif dt_value is not None:
+            logger.warning("Failed to parse datetime '%s'", dt_value)
 
-        # Parse ISO format string using pydrime's utility
-        try:
-            from pydrime.utils import (  # type: ignore[import-not-found]
-                parse_iso_timestamp,
-            )
-
-            parsed = parse_iso_timestamp(dt_value)
-            if parsed is not None:
-                # parse_iso_timestamp returns naive local time
-                # We need to ensure it's in UTC format
-                parsed_dt = cast(datetime, parsed)
-                if parsed_dt.tzinfo is not None:
-                    # Has timezone, convert to UTC and make naive
-                    return parsed_dt.astimezone(timezone.utc).replace(tzinfo=None)
-                # Already naive, assume it's UTC
-                return parsed_dt
-        except (ValueError, AttributeError, ImportError) as e:
-            logger.warning(f"Failed to parse datetime '{dt_value}': {e}")
-
-        return datetime.now(timezone.utc).replace(tzinfo=None)
+        return now or datetime.now(timezone.utc).replace(tzinfo=None)
 
     def _get_etag_for_entry(self, entry: FileEntry, bucket_name: str, key: str) -> str:
         """Get ETag for file entry.
@@ -156,9 +438,22 @@ class DrimeStorageProvider(StorageProvider):
 
         etag = entry.file_name or entry.hash or str(entry.id)
 
-        logger.debug(f"Using Drime UUID ETag for {bucket_name}/{key}: {etag}")
+        logger.debug("Using Drime UUID ETag for %s/%s: %s", bucket_name, key, etag)
         return etag
 
+    @staticmethod
+    def _folder_id_from_response(result_data: Any) -> int | None:
+        """Extract the folder ID from a Drime create_folder response."""
+        folder_data: dict[str, Any] = {}
+        if isinstance(result_data, dict):
+            if "folder" in result_data:
+                folder_data = result_data["folder"]
+            elif "fileEntry" in result_data:
+                folder_data = result_data["fileEntry"]
+            elif "id" in result_data:
+                folder_data = result_data
+        return folder_data.get("id")
+
     def _create_folder_with_retry(
         self, name: str, parent_id: int | None, max_retries: int = 3
     ) -> int | None:
@@ -175,25 +470,15 @@ class DrimeStorageProvider(StorageProvider):
         Raises:
             Exception if folder creation fails after all retries
         """
-        import time
-
         for attempt in range(max_retries):
             try:
                 result_data = self.client.create_folder(
                     name=name, parent_id=parent_id, workspace_id=self.workspace_id
                 )
-                # Extract folder ID from response
-                folder_data: dict[str, Any] = {}
-                if isinstance(result_data, dict):
-                    if "folder" in result_data:
-                        folder_data = result_data["folder"]
-                    elif "fileEntry" in result_data:
-                        folder_data = result_data["fileEntry"]
-                    elif "id" in result_data:
-                        folder_data = result_data
-
-                folder_id = folder_data.get("id")
-                logger.debug(f"Created folder '{name}' with ID {folder_id}")
+                folder_id = self._folder_id_from_response(result_data)
+                logger.debug("Created folder '%s' with ID %s", name, folder_id)
+                self._invalidate_dir(parent_id)
+                self._folder_tree_add(parent_id, name, folder_id)
                 return folder_id
 
             except Exception as e:
@@ -201,8 +486,11 @@ class DrimeStorageProvider(StorageProvider):
                 # Check for 422 error (folder already exists)
                 if "422" in error_str:
                     logger.warning(
-                        f"Folder '{name}' got 422 (try {attempt + 1}/{max_retries}), "
-                        f"likely race condition. Retrying..."
+                        "Folder '%s' got 422 (try %d/%d), "
+                        "likely race condition. Retrying...",
+                        name,
+                        attempt + 1,
+                        max_retries,
                     )
 
                     # Sleep with exponential backoff
@@ -211,47 +499,32 @@ class DrimeStorageProvider(StorageProvider):
                         time.sleep(sleep_time)
 
                         # Try to find the folder that was created by another process
-                        from pydrime.models import (
-                            FileEntriesResult,
-                        )
-
-                        params: dict[str, Any] = {
-                            "workspace_id": self.workspace_id,
-                            "per_page": 1000,
-                        }
-                        if parent_id is not None:
-                            params["parent_ids"] = [parent_id]
-
-                        result = self.client.get_file_entries(**params)
-                        file_entries = FileEntriesResult.from_api_response(result)
-
-                        # Filter for root if no parent
-                        entries = file_entries.entries
-                        if parent_id is None:
-                            entries = [
-                                e
-                                for e in entries
-                                if e.parent_id is None or e.parent_id == 0
-                            ]
+                        self._invalidate_dir(parent_id)
+                        folders = self._list_folders(parent_id)
 
                         # Find the folder
-                        for entry in entries:
-                            if entry.name.lower() == name.lower() and entry.is_folder:
+                        for entry in folders.values():
+                            if entry.name.lower() == name.lower():
                                 logger.info(
-                                    f"Found folder '{name}' after 422 error "
-                                    f"(ID: {entry.id})"
+                                    "Found folder '%s' after 422 error (ID: %s)",
+                                    name,
+                                    entry.id,
                                 )
                                 return cast(int, entry.id)
 
                         logger.warning(
-                            f"Could not find folder '{name}' after 422 error "
-                            f"(attempt {attempt + 1}/{max_retries})"
+                            "Could not find folder '%s' after 422 error "
+                            "(attempt %d/%d)",
+                            name,
+                            attempt + 1,
+                            max_retries,
                         )
                     else:
                         # Max retries exhausted
                         logger.error(
-                            f"Failed to create or find folder '{name}' "
-                            f"after {max_retries} attempts"
+                            "Failed to create or find folder '%s' after %d attempts",
+                            name,
+                            max_retries,
                         )
                         raise Exception(
                             f"Race condition: folder '{name}' failed "
@@ -259,11 +532,390 @@ class DrimeStorageProvider(StorageProvider):
                         ) from e
                 else:
                     # Other error, don't retry
-                    logger.error(f"Failed to create folder '{name}': {e}")
+                    logger.error("Failed to create folder '%s': %s", name, e)
                     raise
 
         return None
 
+    def _folder_cache_get(self, folder_path: str) -> Any:
+        """Look up a folder path in the cache.
+
+        Args:
+            folder_path: Folder path relative to root_folder
+
+        Returns:
+            Cached folder ID, None if the path is cached as missing, or
+            _MISSING if there is no valid cache entry
+        """
+        cached = self._folder_cache.get(folder_path)
+        if cached is None:
+            return _MISSING
+        folder_id, fetched_at, refreshing = cached
+        age = time.monotonic() - fetched_at
+        if age <= self._cache_ttl:
+            return folder_id
+        if age > self._cache_ttl * _CACHE_STALE_FACTOR:
+            self._folder_cache.pop(folder_path, None)
+            return _MISSING
+
+        # Serve the stale result while it is refreshed in the background;
+        # the lock makes sure only one refresh and one executor are started
+        if not refreshing:
+            with self._folder_cache.lock:
+                current = self._folder_cache.get(folder_path)
+                if current is None or current[2]:
+                    return folder_id
+                self._folder_cache[folder_path] = (folder_id, fetched_at, True)
+                if self._refresher is None:
+                    self._refresher = ThreadPoolExecutor(
+                        max_workers=2, thread_name_prefix="drime-refresh"
+                    )
+                self._refresher.submit(self._refresh_folder_path, folder_path)
+        return folder_id
+
+    def _refresh_folder_path(self, folder_path: str) -> None:
+        """Look up a cached folder path again and update its cache entry."""
+        parent_path, _, name = folder_path.rpartition("/")
+        try:
+            parent_id = self._get_folder_id_by_path(parent_path)
+            if parent_id is None and parent_path:
+                self._folder_cache_put(folder_path, None)
+                return
+            self._invalidate_dir(parent_id)
+            found = self._list_folders(parent_id).get(name)
+            self._folder_cache_put(folder_path, found.id if found else None)
+        except Exception as e:
+            logger.debug("Failed to refresh folder %s: %s", folder_path, e)
+            # Let the next lookup past the TTL try again
+            self._folder_cache.pop(folder_path, None)
+
+    def _folder_cache_put(self, folder_path: str, folder_id: int | None) -> None:
+        """Store a folder lookup result (None for a missing folder)."""
+        self._folder_cache[folder_path] = (folder_id, time.monotonic(), False)
+
+    def _invalidate_folder_path(self, folder_path: str) -> None:
+        """Drop cache entries for a folder path and all of its ancestors."""
+        path = folder_path
+        while path:
+            self._folder_cache.pop(path, None)
+            path = path.rpartition("/")[0]
+
+    def _load_folder_tree(self) -> dict[tuple[int | None, str], int]:
+        """Return the workspace folder tree, fetching it if needed.
+
+        The tree comes from a single request for all of the user's folders,
+        so resolving a deep path does not cost one listing per level.
+
+        Returns:
+            Dictionary mapping (parent folder ID, name) to folder ID; empty
+            if the folders cannot be fetched
+        """
+        with self._folder_tree_lock:
+            tree = self._folder_tree
+            if tree is not None and (
+                time.monotonic() - self._folder_tree_at < self._cache_ttl
+            ):
+                return tree
+
+            tree = {}
+            if self._folder_tree_supported:
+                try:
+                    if self._user_id is None:
+                        self._user_id = self.client.get_logged_user()["user"]["id"]
+                    result = self.client.get_user_folders(
+                        self._user_id, self.workspace_id
+                    )
+                    for folder in result.get("folders") or []:
+                        parent_id = folder.get("parent_id") or None
+                        tree[(parent_id, folder["name"])] = folder["id"]
+                except Exception as e:
+                    tree = {}
+                    if isinstance(e, AttributeError) or _is_api_status(e, 403, 404):
+                        logger.debug("Falling back to per-folder lookups: %s", e)
+                        self._folder_tree_supported = False
+                    else:
+                        # Transient failure: retry once the empty tree expires
+                        logger.debug("Failed to load folder tree: %s", e)
+
+            self._folder_tree = tree
+            self._folder_tree_at = time.monotonic()
+            return tree
+
+    def _folder_tree_add(
+        self, parent_id: int | None, name: str, folder_id: int | None
+    ) -> None:
+        """Record a newly created folder in a loaded folder tree."""
+        with self._folder_tree_lock:
+            if self._folder_tree is not None and folder_id is not None:
+                self._folder_tree[(parent_id, name)] = folder_id
+
+    def _invalidate_folder_tree(self) -> None:
+        """Drop the folder tree so it is fetched again on the next lookup."""
+        with self._folder_tree_lock:
+            self._folder_tree = None
+
+    def _iter_file_entries(self, **params: Any) -> Iterator[FileEntry]:
+        """Yield the entries of a Drime listing, following all result pages.
+
+        Args:
+            **params: Parameters for client.get_file_entries (without page)
+
+        Yields:
+            FileEntry objects in API order
+        """
+        per_page = params.setdefault("per_page", _PAGE_SIZE)
+        page = 1
+        while True:
+            result = self.client.get_file_entries(page=page, **params)
+            file_entries = FileEntriesResult.from_api_response(result)
+            entries = file_entries.entries
+            yield from entries
+
+            if not entries:
+                return
+            pagination = file_entries.pagination
+            last_page = pagination.get("last_page") if pagination else None
+            if isinstance(last_page, int):
+                if page >= last_page:
+                    return
+            elif len(entries) < per_page:
+                # Without page information, a short page is the last one
+                return
+            page += 1
+
+    def _list_dir(
+        self, folder_id: int | None
+    ) -> tuple[dict[str, FileEntry], dict[str, FileEntry]]:
+        """List the entries directly inside a folder.
+
+        Listings are kept in the directory index for cache_ttl seconds.
+        Folders and files are indexed separately since a folder and a file
+        may share a name.
+
+        Args:
+            folder_id: Parent folder ID (None for root)
+
+        Returns:
+            Tuple of (folder name -> FileEntry, file name -> FileEntry)
+        """
+        cached = self._dir_index_get(folder_id)
+        if cached is not None:
+            return cached
+
+        # Parent ID 0 scopes the query to the root level; without parent_ids
+        # the API returns every entry of the workspace
+        entries = self._iter_file_entries(
+            workspace_id=self.workspace_id,
+            parent_ids=[folder_id if folder_id is not None else 0],
+        )
+
+        # Filter for root if no parent
+        if folder_id is None:
+            entries = (e for e in entries if e.parent_id is None or e.parent_id == 0)
+
+        folders: dict[str, FileEntry] = {}
+        files: dict[str, FileEntry] = {}
+        for entry in entries:
+            if entry.is_folder:
+                folders[entry.name] = entry
+            else:
+                files[entry.name] = entry
+        self._dir_index[folder_id] = (time.monotonic(), folders, files)
+        return folders, files
+
+    def _list_folders(self, folder_id: int | None) -> dict[str, FileEntry]:
+        """List the folders directly inside a folder, keyed by name."""
+        return self._list_dir(folder_id)[0]
+
+    def _list_files(self, folder_id: int | None) -> dict[str, FileEntry]:
+        """List the files (not folders) directly inside a folder, keyed by name."""
+        return self._list_dir(folder_id)[1]
+
+    def _dir_index_get(
+        self, folder_id: int | None
+    ) -> tuple[dict[str, FileEntry], dict[str, FileEntry]] | None:
+        """Return a folder's indexed listing, or None if absent or expired."""
+        cached = self._dir_index.get(folder_id)
+        if cached is not None and time.monotonic() - cached[0] <= self._cache_ttl:
+            return cached[1], cached[2]
+        return None
+
+    def _prefetch_dirs(self, folder_ids: Iterable[int | None]) -> None:
+        """Fetch several folder listings into the directory index in parallel.
+
+        Args:
+            folder_ids: Folder IDs to list (None for root)
+        """
+        missing = [
+            folder_id
+            for folder_id in set(folder_ids)
+            if self._dir_index_get(folder_id) is None
+        ]
+        if len(missing) <= 1:
+            for folder_id in missing:
+                self._list_dir(folder_id)
+            return
+
+        max_workers = min(self._max_concurrency, len(missing))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the iterator so listing errors are raised here
+            list(executor.map(self._list_dir, missing))
+
+    def _invalidate_dir(self, folder_id: int | None) -> None:
+        """Drop the directory index entry for a folder after it changed."""
+        self._dir_index.pop(folder_id, None)
+
+    def _index_uploaded_file(
+        self, folder_id: int | None, filename: str, result: Any
+    ) -> None:
+        """Add an uploaded file to its folder's indexed listing.
+
+        The listing is updated in place of being refetched; if the upload
+        response carries no usable file entry, it is dropped instead.
+
+        Args:
+            folder_id: Folder the file was uploaded to (None for root)
+            filename: Name of the uploaded file
+            result: Response of the Drime upload call
+        """
+        entry = None
+        if isinstance(result, dict):
+            entry_data = result.get("fileEntry") or result.get("file")
+            if isinstance(entry_data, dict):
+                try:
+                    entry = FileEntry.from_dict(entry_data)
+                except Exception:
+                    entry = None
+
+        with self._dir_index.lock:
+            cached = self._dir_index_get(folder_id)
+            if entry is None or entry.name != filename or cached is None:
+                self._invalidate_dir(folder_id)
+                return
+            # Replace rather than mutate the dict callers may be iterating
+            folders, files = cached
+            self._dir_index[folder_id] = (
+                time.monotonic(),
+                folders,
+                {**files, filename: entry},
+            )
+
+    def _unindex_files(self, folder_id: int | None, filenames: Iterable[str]) -> None:
+        """Remove deleted files from their folder's indexed listing.
+
+        Only the given names are evicted, so lookups of the folder's other
+        files keep being served from the index.
+
+        Args:
+            folder_id: Folder the files were deleted from (None for root)
+            filenames: Names of the deleted files
+        """
+        with self._dir_index.lock:
+            cached = self._dir_index.get(folder_id)
+            if cached is None:
+                return
+            fetched_at, folders, files = cached
+            # Replace rather than mutate the dict callers may be iterating
+            remaining = dict(files)
+            for filename in filenames:
+                remaining.pop(filename, None)
+            self._dir_index[folder_id] = (fetched_at, folders, remaining)
+
+    def _object_meta_get(self, bucket_name: str, key: str) -> S3Object | None:
+        """Return cached object metadata, or None if absent or expired."""
+        cache_key = (bucket_name, key)
+        cached = self._object_meta_cache.get(cache_key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] > self._object_cache_ttl:
+            self._object_meta_cache.pop(cache_key, None)
+            return None
+        return cached[1]
+
+    def _object_meta_put(self, bucket_name: str, key: str, obj: S3Object) -> None:
+        """Cache object metadata, evicting the least recently used entry."""
+        self._object_meta_cache[(bucket_name, key)] = (time.monotonic(), obj)
+
+    def _invalidate_object(self, bucket_name: str, key: str) -> None:
+        """Drop cached metadata for an object after it changed."""
+        self._object_meta_cache.pop((bucket_name, key), None)
+
+    def _cached_prefix(
+        self, folder_path: str, depth: int
+    ) -> tuple[int, int, int | None]:
+        """Find the longest prefix of a folder path with a cached folder ID.
+
+        Args:
+            folder_path: Folder path with "/" separators
+            depth: Number of components in folder_path
+
+        Returns:
+            Tuple of (number of leading parts resolved, length of that prefix
+            in folder_path, their folder ID). Falls back to (0, 0, root folder
+            ID) when no prefix is cached.
+        """
+        # Shorten the path at its last "/" instead of re-joining parts
+        end = len(folder_path)
+        for resolved in range(depth, 0, -1):
+            cached = self._folder_cache_get(folder_path[:end])
+            if cached is not _MISSING and cached is not None:
+                return resolved, end, cast(int, cached)
+            end = folder_path.rfind("/", 0, end)
+        return 0, 0, self._root_folder_id if self.root_folder else None
+
+    def _resolve_paths_many(self, folder_paths: Iterable[str]) -> dict[str, int | None]:
+        """Resolve many folder paths without creating missing folders.
+
+        All paths are walked one level at a time; the listings needed for a
+        level are fetched in parallel, once per distinct parent folder.
+
+        Args:
+            folder_paths: Folder paths relative to root_folder
+
+        Returns:
+            Dictionary mapping each path to its folder ID (None if missing)
+        """
+        root_id = self._root_folder_id if self.root_folder else None
+        results: dict[str, int | None] = {}
+        # path -> (parts, number of parts resolved, length of the resolved
+        # prefix, folder ID reached)
+        pending: dict[str, tuple[list[str], int, int, int | None]] = {}
+
+        for folder_path in set(folder_paths):
+            if not folder_path:
+                results[folder_path] = root_id
+                continue
+            cached = self._folder_cache_get(folder_path)
+            if cached is not _MISSING:
+                results[folder_path] = cached
+                continue
+            parts = folder_path.split("/")
+            depth, end, folder_id = self._cached_prefix(folder_path, len(parts))
+            pending[folder_path] = (parts, depth, end, folder_id)
+
+        while pending:
+            self._prefetch_dirs(folder_id for *_, folder_id in pending.values())
+
+            next_pending: dict[str, tuple[list[str], int, int, int | None]] = {}
+            for folder_path, (parts, depth, end, folder_id) in pending.items():
+                end = _next_prefix_end(folder_path, end)
+                partial_path = folder_path[:end]
+                found = self._list_folders(folder_id).get(parts[depth])
+                if found is None:
+                    self._folder_cache_put(partial_path, None)
+                    self._folder_cache_put(folder_path, None)
+                    results[folder_path] = None
+                    continue
+
+                self._folder_cache_put(partial_path, found.id)
+                if depth + 1 == len(parts):
+                    results[folder_path] = found.id
+                else:
+                    next_pending[folder_path] = (parts, depth + 1, end, found.id)
+            pending = next_pending
+
+        return results
+
     def _get_folder_id_by_path(
         self, folder_path: str, create: bool = False
     ) -> int | None:
@@ -281,49 +933,44 @@ class DrimeStorageProvider(StorageProvider):
             # If root_folder is set, return its ID, otherwise workspace root
             return self._root_folder_id if self.root_folder else None
 
-        # Check cache first
-        if folder_path in self._folder_cache:
-            return self._folder_cache[folder_path]
-
-        from pydrime.models import FileEntriesResult
+        # Check cache first (cached misses are ignored when creating)
+        cached = self._folder_cache_get(folder_path)
+        if cached is not _MISSING and (cached is not None or not create):
+            return cast("int | None", cached)
 
         parts = folder_path.split("/")
-        # Start from root_folder if set, otherwise workspace root
-        current_folder_id: int | None = (
-            self._root_folder_id if self.root_folder else None
-        )
+        # Start from the longest cached prefix (or the root)
+        start, end, current_folder_id = self._cached_prefix(folder_path, len(parts))
 
-        for i, part in enumerate(parts):
+        for i in range(start, len(parts)):
+            part = parts[i]
             # Check cache for partial path
-            partial_path = "/".join(parts[: i + 1])
-            if partial_path in self._folder_cache:
-                current_folder_id = self._folder_cache[partial_path]
-                continue
-
-            # Get entries in current folder
-            params: dict[str, Any] = {
-                "workspace_id": self.workspace_id,
-                "per_page": 1000,
-            }
-            if current_folder_id is not None:
-                params["parent_ids"] = [current_folder_id]
-
-            result = self.client.get_file_entries(**params)
-            file_entries = FileEntriesResult.from_api_response(result)
+            end = _next_prefix_end(folder_path, end)
+            partial_path = folder_path[:end]
+            cached = self._folder_cache_get(partial_path)
+            if cached is not _MISSING:
+                if cached is not None:
+                    current_folder_id = cached
+                    continue
+                if not create:
+                    # A parent is known to be missing
+                    return None
 
-            # Filter for root if no parent
-            entries = file_entries.entries
-            if current_folder_id is None:
-                entries = [
-                    e for e in entries if e.parent_id is None or e.parent_id == 0
-                ]
+            # Try the workspace folder tree before listing the current folder
+            tree_id = self._load_folder_tree().get((current_folder_id, part))
+            if tree_id is not None:
+                current_folder_id = tree_id
+                self._folder_cache_put(partial_path, current_folder_id)
+                continue
 
-            # Find the folder
-            found = None
-            for entry in entries:
-                if entry.name == part and entry.is_folder:
-                    found = entry
-                    break
+            folders = self._list_folders(current_folder_id)
+            if i == 0:
+                # Remember every bucket (or top-level folder) seen, as
+                # list_buckets does, so later bucket lookups need no listing
+                for name, entry in folders.items():
+                    if name != part:
+                        self._folder_cache_put(name, entry.id)
+            found = folders.get(part)
 
             if found is None:
                 if create and not self.readonly:
@@ -334,89 +981,95 @@ class DrimeStorageProvider(StorageProvider):
                     if current_folder_id is None:
                         return None
                 else:
+                    # Remember the miss for this prefix and the full path
+                    self._folder_cache_put(partial_path, None)
+                    self._folder_cache_put(folder_path, None)
                     return None
             else:
                 current_folder_id = found.id
 
             # Cache the result
-            self._folder_cache[partial_path] = current_folder_id
+            self._folder_cache_put(partial_path, current_folder_id)
 
         return current_folder_id
 
-    def _get_file_entry(self, folder_id: int | None, filename: str) -> FileEntry | None:
-        """Get a file entry by name in a folder.
+    def _entry_to_object(
+        self,
+        entry: FileEntry,
+        bucket_name: str,
+        key: str,
+        now: datetime | None = None,
+    ) -> S3Object:
+        """Build the S3Object metadata for a Drime file entry.
 
         Args:
-            folder_id: Parent folder ID (None for root)
-            filename: Name of the file
+            entry: Drime file entry
+            bucket_name: S3 bucket name
+            key: S3 object key
+            now: Naive UTC fallback for a missing modification time
 
         Returns:
-            FileEntry or None if not found
+            S3Object without data
         """
-        from pydrime.models import FileEntriesResult
+        return S3Object(
+            key=key,
+            size=entry.file_size or 0,
+            last_modified=self._parse_datetime(
+                entry.updated_at or entry.created_at, now
+            ),
+            etag=self._get_etag_for_entry(entry, bucket_name, key),
+            content_type=entry.mime or "application/octet-stream",
+        )
 
-        params: dict[str, Any] = {
-            "workspace_id": self.workspace_id,
-            "per_page": 1000,
-        }
-        if folder_id is not None:
-            params["parent_ids"] = [folder_id]
+    def _split_key(self, bucket_name: str, key: str) -> tuple[str, str]:
+        """Split an object key into its folder path and file name.
 
-        result = self.client.get_file_entries(**params)
-        file_entries = FileEntriesResult.from_api_response(result)
+        Args:
+            bucket_name: Name of bucket (empty for root level)
+            key: Object key
 
-        # Filter for root if no parent
-        entries = file_entries.entries
-        if folder_id is None:
-            entries = [e for e in entries if e.parent_id is None or e.parent_id == 0]
+        Returns:
+            Tuple of (folder path relative to root_folder, file name)
+        """
+        subfolder, _, filename = key.rpartition("/")
+        if not subfolder:
+            return bucket_name, filename
+        # Handle empty bucket_name (root level)
+        if bucket_name:
+            return f"{bucket_name}/{subfolder}", filename
+        return subfolder, filename
 
-        for entry in entries:
-            if entry.name == filename and not entry.is_folder:
-                return entry
+    def _get_file_entry(self, folder_id: int | None, filename: str) -> FileEntry | None:
+        """Get a file entry by name in a folder.
 
-        return None
+        Args:
+            folder_id: Parent folder ID (None for root)
+            filename: Name of the file
+
+        Returns:
+            FileEntry or None if not found
+        """
+        return self._list_files(folder_id).get(filename)
 
     def list_buckets(self) -> list[Bucket]:
         """List all buckets (top-level folders in workspace or root_folder)."""
         try:
-            from pydrime.models import (
-                FileEntriesResult,
-            )
-
             # Determine parent folder for buckets
             parent_folder_id = self._root_folder_id if self.root_folder else None
 
-            # Get folders at the appropriate level
-            params: dict[str, Any] = {
-                "workspace_id": self.workspace_id,
-                "per_page": 1000,
-            }
-
-            result = self.client.get_file_entries(**params)
-            file_entries = FileEntriesResult.from_api_response(result)
-
-            # Filter for folders at the correct level
-            if parent_folder_id is not None:
-                # List folders within root_folder
-                entries = [
-                    e
-                    for e in file_entries.entries
-                    if e.parent_id == parent_folder_id and e.is_folder
-                ]
-            else:
-                # List folders at workspace root
-                entries = [
-                    e
-                    for e in file_entries.entries
-                    if (e.parent_id is None or e.parent_id == 0) and e.is_folder
-                ]
+            # The listing is shared with bucket lookups through the directory
+            # index; changes made here already invalidate it
+            folders = self._list_folders(parent_folder_id)
 
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
             buckets = []
-            for entry in entries:
+            for entry in folders.values():
+                # Remember the bucket's folder ID for later lookups
+                self._folder_cache_put(entry.name, entry.id)
                 # Convert Drime folder to S3 bucket
                 bucket = Bucket(
                     name=entry.name,
-                    creation_date=self._parse_datetime(entry.created_at),
+                    creation_date=self._parse_datetime(entry.created_at, now),
                 )
                 buckets.append(bucket)
 
@@ -438,15 +1091,31 @@ class DrimeStorageProvider(StorageProvider):
             raise PermissionError("Provider is in read-only mode")
 
         try:
-            # Check if bucket already exists
-            if self.bucket_exists(bucket_name):
+            # A cached bucket is known to exist; otherwise let Drime decide
+            if self._folder_cache_get(bucket_name) not in (_MISSING, None):
                 raise BucketAlreadyExists(bucket_name)
 
             # Create folder at appropriate level
             parent_id = self._root_folder_id if self.root_folder else None
-            self.client.create_folder(
-                name=bucket_name, parent_id=parent_id, workspace_id=self.workspace_id
-            )
+            try:
+                result = self.client.create_folder(
+                    name=bucket_name,
+                    parent_id=parent_id,
+                    workspace_id=self.workspace_id,
+                )
+            except Exception as e:
+                # Drime answers 422 if the folder already exists
+                if "422" in str(e):
+                    raise BucketAlreadyExists(bucket_name) from e
+                raise
+            self._invalidate_dir(parent_id)
+            # Record the new bucket, replacing a cached "does not exist"
+            folder_id = self._folder_id_from_response(result)
+            self._folder_tree_add(parent_id, bucket_name, folder_id)
+            if folder_id is not None:
+                self._folder_cache_put(bucket_name, folder_id)
+            else:
+                self._invalidate_folder_path(bucket_name)
 
             if self.root_folder:
                 logger.info(
@@ -485,10 +1154,6 @@ class DrimeStorageProvider(StorageProvider):
             raise PermissionError("Provider is in read-only mode")
 
         try:
-            from pydrime.models import (
-                FileEntriesResult,
-            )
-
             # Get the folder ID
             folder_id = self._get_folder_id_by_path(bucket_name)
 
@@ -497,28 +1162,30 @@ class DrimeStorageProvider(StorageProvider):
 
             # Check if bucket is empty (unless force=True)
             if not force:
-                params: dict[str, Any] = {
-                    "workspace_id": self.workspace_id,
-                    "parent_ids": [folder_id],
-                    "per_page": 1,
-                }
-                result = self.client.get_file_entries(**params)
-                file_entries = FileEntriesResult.from_api_response(result)
-
-                if len(file_entries.entries) > 0:
+                # Only the first one-entry page is fetched
+                first_entry = next(
+                    self._iter_file_entries(
+                        workspace_id=self.workspace_id,
+                        parent_ids=[folder_id],
+                        per_page=1,
+                    ),
+                    None,
+                )
+                if first_entry is not None:
                     raise BucketNotEmpty(bucket_name)
 
             # Delete the folder (Drime API will delete all contents recursively)
             self.client.delete_file_entries([folder_id], workspace_id=self.workspace_id)
 
             # Clear cache entries for this bucket and all subfolders
-            to_remove = [
-                k
-                for k in self._folder_cache
-                if k == bucket_name or k.startswith(f"{bucket_name}/")
-            ]
-            for k in to_remove:
-                del self._folder_cache[k]
+            bucket_prefix = f"{bucket_name}/"
+            self._folder_cache.discard_where(
+                lambda k: k == bucket_name or k.startswith(bucket_prefix)
+            )
+            # Listings of the bucket, its subfolders and its parent are stale
+            self._dir_index.clear()
+            self._invalidate_folder_tree()
+            self._object_meta_cache.discard_where(lambda k: k[0] == bucket_name)
 
             logger.info(f"Deleted bucket: {bucket_name}")
             return True
@@ -548,10 +1215,33 @@ class DrimeStorageProvider(StorageProvider):
             creation_date=datetime.now(timezone.utc),
         )
 
+    def _list_children(self, folder_id: int | None) -> list[FileEntry]:
+        """Fetch the entries directly inside a folder, bypassing the index.
+
+        Args:
+            folder_id: Folder ID to list (None for root)
+
+        Returns:
+            List of FileEntry objects in API order
+        """
+        entries = self._iter_file_entries(
+            workspace_id=self.workspace_id,
+            parent_ids=[folder_id if folder_id is not None else 0],
+        )
+        if folder_id is None:
+            # Root level - filter for entries with no parent or parent_id=0
+            return [e for e in entries if e.parent_id is None or e.parent_id == 0]
+        # The API already limits the listing to children of parent_ids, like
+        # the directory index assumes
+        return list(entries)
+
     def _collect_all_objects(
         self, folder_id: int | None, current_path: str = ""
     ) -> list[tuple[str, FileEntry]]:
-        """Recursively collect all objects with their full paths.
+        """Collect all objects below a folder with their full paths.
+
+        The folder tree is walked breadth-first; the listings of all folders
+        on one level are fetched in parallel.
 
         Args:
             folder_id: Folder ID to start from (None for root)
@@ -560,48 +1250,35 @@ class DrimeStorageProvider(StorageProvider):
         Returns:
             List of tuples (full_key, entry)
         """
-        from pydrime.models import FileEntriesResult
-
         result_objects: list[tuple[str, FileEntry]] = []
+        # Folders of the current level as (folder ID, path)
+        level: list[tuple[int | None, str]] = [(folder_id, current_path)]
 
-        params: dict[str, Any] = {
-            "workspace_id": self.workspace_id,
-            "per_page": 1000,
-        }
-        if folder_id is not None:
-            params["parent_ids"] = [folder_id]
-
-        logger.debug(
-            f"Collecting objects from folder_id={folder_id}, path={current_path}"
-        )
-        result = self.client.get_file_entries(**params)
-        file_entries = FileEntriesResult.from_api_response(result)
-
-        # Filter to only include immediate children of this folder
-        entries = file_entries.entries
-        if folder_id is None:
-            # Root level - filter for entries with no parent or parent_id=0
-            entries = [e for e in entries if e.parent_id is None or e.parent_id == 0]
-        else:
-            # Filter for entries that are direct children of this folder
-            entries = [e for e in entries if e.parent_id == folder_id]
-
-        logger.debug(f"Found {len(entries)} immediate children")
-
-        for entry in entries:
-            # Build full key
-            if current_path:
-                full_key = f"{current_path}/{entry.name}"
-            else:
-                full_key = entry.name
-
-            if entry.is_folder:
-                # Recursively collect from subfolder
-                subfolder_objects = self._collect_all_objects(entry.id, full_key)
-                result_objects.extend(subfolder_objects)
-            else:
-                # Add file object
-                result_objects.append((full_key, entry))
+        executor: ThreadPoolExecutor | None = None
+        try:
+            while level:
+                logger.debug("Collecting objects from %d folder(s)", len(level))
+                folder_ids = [fid for fid, _ in level]
+                if len(level) == 1:
+                    listings = [self._list_children(folder_ids[0])]
+                else:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+                    listings = list(executor.map(self._list_children, folder_ids))
+
+                next_level: list[tuple[int | None, str]] = []
+                for (_, path), entries in zip(level, listings):
+                    for entry in entries:
+                        # Build full key
+                        full_key = f"{path}/{entry.name}" if path else entry.name
+                        if entry.is_folder:
+                            next_level.append((entry.id, full_key))
+                        else:
+                            result_objects.append((full_key, entry))
+                level = next_level
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         return result_objects
 
@@ -619,27 +1296,11 @@ class DrimeStorageProvider(StorageProvider):
             - files: List of tuples (key, entry) for files only
             - folder_names: List of folder names
         """
-        from pydrime.models import FileEntriesResult
-
-        params: dict[str, Any] = {
-            "workspace_id": self.workspace_id,
-            "per_page": 1000,
-        }
-        if folder_id is not None:
-            params["parent_ids"] = [folder_id]
-
         logger.debug(
             f"Listing immediate children from folder_id={folder_id}, prefix={prefix}"
         )
-        result = self.client.get_file_entries(**params)
-        file_entries = FileEntriesResult.from_api_response(result)
 
-        # Filter to only include immediate children
-        entries = file_entries.entries
-        if folder_id is None:
-            entries = [e for e in entries if e.parent_id is None or e.parent_id == 0]
-        else:
-            entries = [e for e in entries if e.parent_id == folder_id]
+        entries = self._list_children(folder_id)
 
         logger.debug(f"Found {len(entries)} immediate children")
 
@@ -676,90 +1337,61 @@ class DrimeStorageProvider(StorageProvider):
             if folder_id is None and bucket_name:
                 raise NoSuchBucket(bucket_name)
 
-            # Optimization: When delimiter is present, only list immediate children
+            # Optimization: With the "/" delimiter, S3 prefixes map onto Drime
+            # folders, so only the immediate children of one folder are listed.
             # This avoids recursively scanning the entire tree
-            if delimiter:
-                # Handle prefix - if it contains delimiter, we need to navigate
-                # to that folder
-                if prefix and delimiter in prefix:
-                    # Navigate to the prefix folder
-                    prefix_parts = prefix.rstrip(delimiter).split(delimiter)
-                    prefix_folder = (
-                        delimiter.join(prefix_parts[:-1])
-                        if len(prefix_parts) > 1
-                        else ""
+            if delimiter == "/":
+                # Navigate to the folder named by the prefix up to its last
+                # delimiter; the rest filters entry names in that folder
+                prefix_folder, _, remaining_prefix = prefix.rpartition(delimiter)
+                key_base = f"{prefix_folder}{delimiter}" if prefix_folder else ""
+
+                if prefix_folder:
+                    folder_path = (
+                        f"{bucket_name}/{prefix_folder}"
+                        if bucket_name
+                        else prefix_folder
                     )
-                    remaining_prefix = prefix_parts[-1] if prefix_parts else ""
-
-                    # Get folder for the prefix path
-                    if prefix_folder:
-                        folder_path = (
-                            f"{bucket_name}/{prefix_folder}"
-                            if bucket_name
-                            else prefix_folder
-                        )
-                        folder_id = self._get_folder_id_by_path(folder_path)
-                        if folder_id is None and folder_path:
-                            # Prefix folder doesn't exist
-                            return {
-                                "contents": [],
-                                "common_prefixes": [],
-                                "is_truncated": False,
-                                "next_marker": "",
-                            }
-                else:
-                    remaining_prefix = prefix
+                    folder_id = self._get_folder_id_by_path(folder_path)
+                    if folder_id is None:
+                        # Prefix folder doesn't exist
+                        return {
+                            "contents": [],
+                            "common_prefixes": [],
+                            "is_truncated": False,
+                            "next_marker": "",
+                        }
 
                 # List immediate children only
                 files, folders = self._list_immediate_children(
                     folder_id, remaining_prefix
                 )
 
-                # Build results
-                contents = []
-                common_prefixes: set[str] = set()
-
-                # Add files to contents
-                for key, entry in files:
-                    full_key = (
-                        f"{prefix.rstrip(delimiter)}{delimiter}{key}"
-                        if prefix and not remaining_prefix
-                        else key
-                    )
-                    if marker and full_key <= marker:
-                        continue
-
-                    obj = S3Object(
-                        key=full_key,
-                        size=entry.file_size or 0,
-                        last_modified=self._parse_datetime(
-                            entry.updated_at or entry.created_at
-                        ),
-                        etag=self._get_etag_for_entry(entry, bucket_name, full_key),
-                        content_type=entry.mime or "application/octet-stream",
-                    )
-                    contents.append(obj)
-
-                # Add folders as common prefixes
-                for folder_name in folders:
-                    if prefix:
-                        prefix_stripped = prefix.rstrip(delimiter)
-                        common_prefix = (
-                            f"{prefix_stripped}{delimiter}{folder_name}{delimiter}"
-                        )
-                    else:
-                        common_prefix = f"{folder_name}{delimiter}"
-                    common_prefixes.add(common_prefix)
+                # Merge files and folders (as common prefixes) in key order;
+                # S3 counts both against max_keys and applies the marker to both
+                items: list[tuple[str, FileEntry | None]] = [
+                    (f"{key_base}{name}", entry) for name, entry in files
+                ]
+                items.extend((f"{key_base}{name}{delimiter}", None) for name in folders)
+                if marker:
+                    items = [item for item in items if item[0] > marker]
+                items.sort(key=lambda item: item[0])
 
-                # Apply max_keys limit
-                all_items = contents + [None] * len(common_prefixes)
-                is_truncated = len(all_items) > max_keys
+                is_truncated = len(items) > max_keys
                 if is_truncated:
-                    contents = contents[:max_keys]
-                    next_marker = contents[-1].key if contents else ""
+                    items = items[:max_keys]
+                    next_marker = items[-1][0] if items else ""
                 else:
                     next_marker = ""
 
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+                contents = [
+                    self._entry_to_object(entry, bucket_name, full_key, now)
+                    for full_key, entry in items
+                    if entry is not None
+                ]
+                common_prefixes = [key for key, entry in items if entry is None]
+
                 logger.debug(
                     f"Listed {len(contents)} objects, {len(common_prefixes)} prefixes "
                     f"in {bucket_name or 'root'}"
@@ -767,83 +1399,61 @@ class DrimeStorageProvider(StorageProvider):
 
                 return {
                     "contents": contents,
-                    "common_prefixes": sorted(common_prefixes),
+                    "common_prefixes": common_prefixes,
                     "is_truncated": is_truncated,
                     "next_marker": next_marker,
                 }
 
-            # No delimiter - collect all objects recursively (old behavior)
+            # Otherwise collect all objects recursively and apply any other
+            # delimiter to the full keys
             all_objects = self._collect_all_objects(folder_id)
 
-            # Extract keys for filtering
-            all_keys = [key for key, _ in all_objects]
-
-            # Filter by prefix
-            if prefix:
-                all_keys = [k for k in all_keys if k.startswith(prefix)]
-
-            # Filter by marker
-            if marker:
-                all_keys = [k for k in all_keys if k > marker]
-
-            # Sort keys
-            all_keys.sort()
-
-            # Handle delimiter for common prefixes
-            common_prefixes: set[str] = set()
-            contents_keys = []
-
-            if delimiter:
-                for key in all_keys:
-                    # Find the position of the delimiter after the prefix
-                    search_start = len(prefix)
-                    delimiter_pos = key.find(delimiter, search_start)
-
-                    if delimiter_pos != -1:
-                        # This key should be in common prefixes
-                        common_prefix = key[: delimiter_pos + len(delimiter)]
-                        common_prefixes.add(common_prefix)
-                    else:
-                        # This key should be in contents
-                        contents_keys.append(key)
-            else:
-                contents_keys = all_keys
+            # Filter by prefix and marker in one pass, keeping each key
+            # paired with its entry
+            pairs = [
+                pair
+                for pair in all_objects
+                if pair[0].startswith(prefix) and pair[0] > marker
+            ]
+            pairs.sort(key=itemgetter(0))
+
+            # Split keys into contents and common prefixes in one pass
+            prefix_set: set[str] = set()
+            content_pairs: list[tuple[str, FileEntry]] = []
+            # The delimiter is searched for after the prefix
+            search_start = len(prefix)
+            for pair in pairs:
+                key = pair[0]
+                delimiter_pos = key.find(delimiter, search_start) if delimiter else -1
+                if delimiter_pos != -1:
+                    # This key should be in common prefixes
+                    prefix_set.add(key[: delimiter_pos + len(delimiter)])
+                else:
+                    # This key should be in contents
+                    content_pairs.append(pair)
 
             # Apply max_keys limit
-            is_truncated = len(contents_keys) > max_keys
+            is_truncated = len(content_pairs) > max_keys
             if is_truncated:
-                contents_keys = contents_keys[:max_keys]
-                next_marker = contents_keys[-1]
+                content_pairs = content_pairs[:max_keys]
+                next_marker = content_pairs[-1][0]
             else:
                 next_marker = ""
 
-            # Build S3Object instances for contents
-            # Create a lookup dict for quick access
-            objects_dict = {key: entry for key, entry in all_objects}
-
-            contents = []
-            for key in contents_keys:
-                entry = objects_dict.get(key)
-                if entry is not None:
-                    obj = S3Object(
-                        key=key,
-                        size=entry.file_size or 0,
-                        last_modified=self._parse_datetime(
-                            entry.updated_at or entry.created_at
-                        ),
-                        etag=self._get_etag_for_entry(entry, bucket_name, key),
-                        content_type=entry.mime or "application/octet-stream",
-                    )
-                    contents.append(obj)
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            contents = [
+                self._entry_to_object(entry, bucket_name, key, now)
+                for key, entry in content_pairs
+            ]
 
             logger.debug(
                 f"Listed {len(contents)} objects, "
-                f"{len(common_prefixes)} prefixes in {bucket_name}"
+                f"{len(prefix_set)} prefixes in {bucket_name}"
             )
 
             return {
                 "contents": contents,
-                "common_prefixes": sorted(list(common_prefixes)),
+                "common_prefixes": sorted(prefix_set),
                 "is_truncated": is_truncated,
                 "next_marker": next_marker,
             }
@@ -889,18 +1499,7 @@ class DrimeStorageProvider(StorageProvider):
                 md5_hash = hashlib.md5(data).hexdigest()
 
             # Get bucket folder ID (or create path if nested)
-            parts = key.split("/")
-            filename = parts[-1]
-            folder_path = bucket_name
-
-            # Create nested folders if needed
-            if len(parts) > 1:
-                subfolder = "/".join(parts[:-1])
-                # Handle empty bucket_name (root level)
-                if bucket_name:
-                    folder_path = f"{bucket_name}/{subfolder}"
-                else:
-                    folder_path = subfolder
+            folder_path, filename = self._split_key(bucket_name, key)
 
             folder_id = self._get_folder_id_by_path(folder_path, create=True)
 
@@ -908,10 +1507,8 @@ class DrimeStorageProvider(StorageProvider):
             if folder_id is None and folder_path:
                 raise NoSuchBucket(bucket_name)
 
-            # Create temp file and upload
-            tmp_dir = Path(tempfile.gettempdir())
-            tmp_path = tmp_dir / filename
-            tmp_path.write_bytes(data)
+            # pydrime uploads from a path, so stage the data in a temp file
+            tmp_path = _write_staging_file(data, filename)
 
             try:
                 logger.debug(
@@ -923,7 +1520,7 @@ class DrimeStorageProvider(StorageProvider):
                 # For simple files (no nested folders in key),
                 # use upload_file_simple to avoid pydrime's folder path
                 # resolution which can fail with parent_id=None
-                if len(parts) == 1:
+                if "/" not in key:
                     # Simple file upload (no folders in key)
                     result = self.client.upload_file_simple(
                         tmp_path,
@@ -941,6 +1538,8 @@ class DrimeStorageProvider(StorageProvider):
                         relative_path=filename,
                     )
 
+                self._index_uploaded_file(folder_id, filename, result)
+                self._invalidate_object(bucket_name, key)
                 logger.info(f"Uploaded object: {bucket_name}/{key}")
 
                 # Extract UUID (file_name) from result
@@ -978,7 +1577,7 @@ class DrimeStorageProvider(StorageProvider):
                     metadata=metadata or {},
                 )
             finally:
-                tmp_path.unlink(missing_ok=True)
+                _remove_staging_file(tmp_path)
 
         except NoSuchBucket:
             raise
@@ -992,17 +1591,7 @@ class DrimeStorageProvider(StorageProvider):
         """Retrieve an object (download file)."""
         try:
             # Parse key to get folder and filename
-            parts = key.split("/")
-            filename = parts[-1]
-            folder_path = bucket_name
-
-            if len(parts) > 1:
-                subfolder = "/".join(parts[:-1])
-                # Handle empty bucket_name (root level)
-                if bucket_name:
-                    folder_path = f"{bucket_name}/{subfolder}"
-                else:
-                    folder_path = subfolder
+            folder_path, filename = self._split_key(bucket_name, key)
 
             # Get folder ID
             folder_id = self._get_folder_id_by_path(folder_path)
@@ -1046,19 +1635,13 @@ class DrimeStorageProvider(StorageProvider):
 
     def head_object(self, bucket_name: str, key: str) -> S3Object:
         """Get object metadata without downloading content."""
+        cached = self._object_meta_get(bucket_name, key)
+        if cached is not None:
+            return cached
+
         try:
             # Parse key to get folder and filename
-            parts = key.split("/")
-            filename = parts[-1]
-            folder_path = bucket_name
-
-            if len(parts) > 1:
-                subfolder = "/".join(parts[:-1])
-                # Handle empty bucket_name (root level)
-                if bucket_name:
-                    folder_path = f"{bucket_name}/{subfolder}"
-                else:
-                    folder_path = subfolder
+            folder_path, filename = self._split_key(bucket_name, key)
 
             # Get folder ID
             folder_id = self._get_folder_id_by_path(folder_path)
@@ -1073,16 +1656,9 @@ class DrimeStorageProvider(StorageProvider):
             if not file_entry:
                 raise NoSuchKey(key)
 
-            return S3Object(
-                key=key,
-                size=file_entry.file_size or 0,
-                last_modified=self._parse_datetime(
-                    file_entry.updated_at or file_entry.created_at
-                ),
-                etag=self._get_etag_for_entry(file_entry, bucket_name, key),
-                content_type=file_entry.mime or "application/octet-stream",
-                metadata={},
-            )
+            obj = self._entry_to_object(file_entry, bucket_name, key)
+            self._object_meta_put(bucket_name, key, obj)
+            return obj
 
         except (NoSuchBucket, NoSuchKey):
             raise
@@ -1097,17 +1673,7 @@ class DrimeStorageProvider(StorageProvider):
 
         try:
             # Parse key to get folder and filename
-            parts = key.split("/")
-            filename = parts[-1]
-            folder_path = bucket_name
-
-            if len(parts) > 1:
-                subfolder = "/".join(parts[:-1])
-                # Handle empty bucket_name (root level)
-                if bucket_name:
-                    folder_path = f"{bucket_name}/{subfolder}"
-                else:
-                    folder_path = subfolder
+            folder_path, filename = self._split_key(bucket_name, key)
 
             # Get folder ID
             folder_id = self._get_folder_id_by_path(folder_path)
@@ -1126,6 +1692,8 @@ class DrimeStorageProvider(StorageProvider):
             self.client.delete_file_entries(
                 [file_entry.id], workspace_id=self.workspace_id
             )
+            self._unindex_files(folder_id, [filename])
+            self._invalidate_object(bucket_name, key)
 
             logger.info(f"Deleted object: {bucket_name}/{key}")
             return True
@@ -1137,21 +1705,155 @@ class DrimeStorageProvider(StorageProvider):
             raise
 
     def delete_objects(self, bucket_name: str, keys: list[str]) -> dict[str, Any]:
-        """Delete multiple objects."""
+        """Delete multiple objects.
+
+        Keys are grouped by parent folder so every folder is resolved and
+        listed once, and all found files are removed with one API call.
+
+        Args:
+            bucket_name: Name of the bucket
+            keys: List of object keys
+
+        Returns:
+            Dictionary with deleted and errors lists
+        """
         if self.readonly:
             raise PermissionError("Provider is in read-only mode")
 
-        deleted = []
-        errors = []
+        deleted: list[str] = []
+        errors: list[dict[str, str]] = []
 
+        # Group keys by parent folder path
+        keys_by_folder: dict[str, list[tuple[str, str]]] = {}
         for key in keys:
+            folder_path, filename = self._split_key(bucket_name, key)
+            keys_by_folder.setdefault(folder_path, []).append((key, filename))
+
+        # Resolve all folders and fetch their listings in parallel; on failure
+        # fall back to resolving folder by folder below
+        folder_ids: dict[str, int | None] = {}
+        try:
+            folder_ids = self._resolve_paths_many(keys_by_folder)
+            self._prefetch_dirs(
+                folder_id
+                for folder_path, folder_id in folder_ids.items()
+                if folder_id is not None or not folder_path
+            )
+        except Exception as e:
+            logger.warning("Parallel folder lookup failed: %s", e)
+
+        # Look up the requested files in each folder
+        entry_ids: dict[int, None] = {}
+        # (key, entry ID) of every file to delete
+        pending: list[tuple[str, int]] = []
+        # Folder ID -> names of the files being deleted from it
+        changed_folders: dict[int | None, list[str]] = {}
+        for folder_path, folder_keys in keys_by_folder.items():
+            try:
+                if folder_path in folder_ids:
+                    folder_id = folder_ids[folder_path]
+                else:
+                    folder_id = self._get_folder_id_by_path(folder_path)
+                # None is valid for root level (empty bucket_name/folder_path)
+                if folder_id is None and folder_path:
+                    files: dict[str, FileEntry] = {}
+                else:
+                    files = self._list_files(folder_id)
+            except Exception as e:
+                logger.error("Failed to list folder %s: %s", folder_path, e)
+                errors.extend(
+                    {"key": key, "code": "InternalError", "message": str(e)}
+                    for key, _ in folder_keys
+                )
+                continue
+
+            for key, filename in folder_keys:
+                entry = files.get(filename)
+                if entry is None:
+                    errors.append(
+                        {
+                            "key": key,
+                            "code": "NoSuchKey",
+                            "message": "The specified key does not exist.",
+                        }
+                    )
+                else:
+                    entry_ids[entry.id] = None
+                    pending.append((key, entry.id))
+                    changed_folders.setdefault(folder_id, []).append(filename)
+
+        if entry_ids:
             try:
-                self.delete_object(bucket_name, key)
-                deleted.append({"Key": key})
+                self.client.delete_file_entries(
+                    list(entry_ids), workspace_id=self.workspace_id
+                )
+                deleted.extend(key for key, _ in pending)
+                logger.info("Deleted %d objects from %s", len(pending), bucket_name)
+                for folder_id, filenames in changed_folders.items():
+                    self._unindex_files(folder_id, filenames)
             except Exception as e:
-                errors.append({"Key": key, "Code": "InternalError", "Message": str(e)})
+                if len(entry_ids) > 1:
+                    # Retry one by one so a single bad entry does not fail
+                    # the whole batch
+                    logger.warning(
+                        "Batched delete from %s failed, deleting one by one: %s",
+                        bucket_name,
+                        e,
+                    )
+                    failures = self._delete_entries_each(list(entry_ids))
+                else:
+                    failures = {entry_id: e for entry_id in entry_ids}
+                for key, entry_id in pending:
+                    failure = failures.get(entry_id)
+                    if failure is None:
+                        deleted.append(key)
+                    else:
+                        logger.error(
+                            "Failed to delete %s/%s: %s", bucket_name, key, failure
+                        )
+                        errors.append(
+                            {
+                                "key": key,
+                                "code": "InternalError",
+                                "message": str(failure),
+                            }
+                        )
+                # Some files may have been deleted; list the folders again
+                for folder_id in changed_folders:
+                    self._invalidate_dir(folder_id)
+            for key, _ in pending:
+                self._invalidate_object(bucket_name, key)
+
+        return {"deleted": deleted, "errors": errors}
+
+    def _delete_entries_each(self, entry_ids: list[int]) -> dict[int, Exception]:
+        """Delete file entries with one API call each, in parallel.
+
+        Args:
+            entry_ids: IDs of the entries to delete
+
+        Returns:
+            Dictionary mapping the ID of every entry that could not be
+            deleted to the error raised for it
+        """
 
-        return {"Deleted": deleted, "Errors": errors}
+        def delete_one(entry_id: int) -> Exception | None:
+            try:
+                self.client.delete_file_entries(
+                    [entry_id], workspace_id=self.workspace_id
+                )
+            except Exception as e:
+                return e
+            return None
+
+        max_workers = min(self._max_concurrency, len(entry_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(delete_one, entry_ids))
+        return {
+            entry_id: error
+            for entry_id, error in zip(entry_ids, results)
+            if error is not None
+        }
 
     def copy_object(
         self,
@@ -1172,27 +1874,42 @@ class DrimeStorageProvider(StorageProvider):
             S3Object with destination metadata
 
         Raises:
+            NoSuchKey: If the source object does not exist
             PermissionError: If provider is read-only
         """
         if self.readonly:
             raise PermissionError("Provider is in read-only mode")
 
         try:
-            # Get source object
-            src_obj = self.get_object(src_bucket, src_key)
-
-            # Ensure we have data to copy
-            if src_obj.data is None:
-                raise ValueError("Source object has no data")
-
-            # Put to destination, reusing MD5 from source
+            # Locate the source file
+            src_folder_path, src_filename = self._split_key(src_bucket, src_key)
+            src_folder_id = self._get_folder_id_by_path(src_folder_path)
+            if src_folder_id is None and src_folder_path:
+                raise NoSuchKey(src_key)
+            src_entry = self._get_file_entry(src_folder_id, src_filename)
+            if not src_entry:
+                raise NoSuchKey(src_key)
+
+            if src_bucket == dst_bucket and src_key == dst_key:
+                # Copying an object onto itself leaves it unchanged
+                return self.head_object(dst_bucket, dst_key)
+
+            # Let Drime copy the file without transferring its content
+            if self._supports_server_copy:
+                copied = self._copy_entry(src_entry, dst_bucket, dst_key)
+                if copied is not None:
+                    return copied
+
+            # Otherwise download and re-upload the content
+            if not src_entry.hash:
+                raise NoSuchKey(src_key)
+            data: bytes = self.client.get_file_content(src_entry.hash)
             return self.put_object(
                 dst_bucket,
                 dst_key,
-                src_obj.data,
-                src_obj.content_type,
-                src_obj.metadata,
-                md5_hash=src_obj.etag,  # Reuse source MD5
+                data,
+                src_entry.mime or "application/octet-stream",
+                md5_hash=self._get_etag_for_entry(src_entry, src_bucket, src_key),
             )
 
         except Exception as e:
@@ -1201,8 +1918,160 @@ class DrimeStorageProvider(StorageProvider):
             )
             raise
 
+    def _copy_entry(
+        self, src_entry: FileEntry, dst_bucket: str, dst_key: str
+    ) -> S3Object | None:
+        """Copy a file entry server-side to a destination key.
+
+        The entry is duplicated into the destination folder and renamed to
+        the destination file name; an existing destination object is first
+        moved aside under a temporary name, so the rename cannot collide with
+        it, and deleted once the copy is in place. If the copy cannot be put
+        in place, the duplicate is removed again and the destination is
+        restored.
+
+        Args:
+            src_entry: Source file entry
+            dst_bucket: Destination bucket name
+            dst_key: Destination object key
+
+        Returns:
+            S3Object with destination metadata, or None if the API does not
+            support server-side copies
+
+        Raises:
+            NoSuchBucket: If the destination bucket doesn't exist
+            DrimeInvalidResponseError: If Drime does not return the copy
+        """
+        folder_path, filename = self._split_key(dst_bucket, dst_key)
+        folder_id = self._get_folder_id_by_path(folder_path, create=True)
+        # None is valid for root level (empty bucket_name/folder_path)
+        if folder_id is None and folder_path:
+            raise NoSuchBucket(dst_bucket)
+        existing = self._get_file_entry(folder_id, filename)
+
+        try:
+            result = self.client.duplicate_file_entries(
+                [src_entry.id], destination_id=folder_id, workspace_id=self.workspace_id
+            )
+        except Exception as e:
+            if not self._server_copy_unsupported(e, src_entry):
+                raise
+            logger.debug("Falling back to download and upload copies: %s", e)
+            self._supports_server_copy = False
+            return None
+        entries = result.get("entries") if isinstance(result, dict) else None
+        if not entries:
+            from pydrime.exceptions import (  # type: ignore[import-not-found]
+                DrimeInvalidResponseError,
+            )
+
+            raise DrimeInvalidResponseError(
+                f"Drime did not return a copy of entry {src_entry.id}"
+            )
+        copy_id = entries[0].get("id")
+
+        # Only an existing object under another ID can block the rename
+        if existing is not None and existing.id == copy_id:
+            existing = None
+        parked = False
+        try:
+            try:
+                if entries[0].get("name") != filename:
+                    if existing is not None:
+                        self.client.rename_file_entry(
+                            existing.id,
+                            f".{filename}.{copy_id}.replaced",
+                            workspace_id=self.workspace_id,
+                        )
+                        parked = True
+                    self.client.rename_file_entry(
+                        copy_id, filename, workspace_id=self.workspace_id
+                    )
+            except Exception:
+                self._undo_copy(src_entry, copy_id, existing if parked else None)
+                raise
+
+            # The copy is in place; now drop the old destination object
+            if existing is not None:
+                self.client.delete_file_entries(
+                    [existing.id], workspace_id=self.workspace_id
+                )
+        finally:
+            self._invalidate_dir(folder_id)
+            self._invalidate_object(dst_bucket, dst_key)
+
+        logger.info("Copied entry %s to %s/%s", src_entry.id, dst_bucket, dst_key)
+        return self.head_object(dst_bucket, dst_key)
+
+    def _server_copy_unsupported(self, error: Exception, src_entry: FileEntry) -> bool:
+        """Tell whether a failed duplicate call means the endpoint is unusable.
+
+        A 404 only counts against the endpoint if the source entry still
+        exists; otherwise it is an ordinary error for the missing entry.
+
+        Args:
+            error: Exception raised by duplicate_file_entries
+            src_entry: Entry that was to be copied
+
+        Returns:
+            True if server-side copies should no longer be attempted
+        """
+        if isinstance(error, AttributeError) or _is_api_status(error, 405):
+            return True
+        if not _is_api_status(error, 404):
+            return False
+        parent_id = src_entry.parent_id or None
+        self._invalidate_dir(parent_id)
+        found = self._list_files(parent_id).get(src_entry.name)
+        return found is not None and found.id == src_entry.id
+
+    def _undo_copy(
+        self, src_entry: FileEntry, copy_id: int, parked: FileEntry | None
+    ) -> None:
+        """Remove a failed copy and restore the destination it was to replace.
+
+        Cleanup errors are logged, so the error that caused the undo is the
+        one raised to the caller.
+
+        Args:
+            src_entry: Entry that was copied
+            copy_id: ID of the duplicate to remove
+            parked: Existing destination entry moved aside, if any
+        """
+        try:
+            self.client.delete_file_entries([copy_id], workspace_id=self.workspace_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to remove copy %s of entry %s: %s", copy_id, src_entry.id, e
+            )
+        if parked is None:
+            return
+        try:
+            self.client.rename_file_entry(
+                parked.id, parked.name, workspace_id=self.workspace_id
+            )
+        except Exception as e:
+            logger.warning("Failed to restore entry %s: %s", parked.id, e)
+
     def object_exists(self, bucket_name: str, key: str) -> bool:
         """Check if an object exists."""
+        if self._object_meta_get(bucket_name, key) is not None:
+            return True
+
+        # Answer from the cached folder ID and directory listing if possible
+        folder_path, filename = self._split_key(bucket_name, key)
+        if folder_path:
+            folder_id = self._folder_cache_get(folder_path)
+        else:
+            folder_id = self._root_folder_id if self.root_folder else None
+        if folder_id is not _MISSING:
+            if folder_id is None and folder_path:
+                return False
+            listing = self._dir_index_get(folder_id)
+            if listing is not None:
+                return filename in listing[1]
+
         try:
             self.head_object(bucket_name, key)
             return True
@@ -1214,3 +2083,10 @@ class DrimeStorageProvider(StorageProvider):
     def is_readonly(self) -> bool:
         """Check if the provider is in read-only mode."""
         return self.readonly
+
+    def close(self) -> None:
+        """Stop the background folder refresh threads."""
+        with self._folder_cache.lock:
+            refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.shutdown(wait=False, cancel_futures=True)
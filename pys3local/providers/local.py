@@ -395,7 +395,7 @@ class LocalStorageProvider(StorageProvider):
 
         return {
             "contents": contents,
-            "common_prefixes": sorted(list(common_prefixes)),
+            "common_prefixes": sorted(common_prefixes),
             "is_truncated": is_truncated,
             "next_marker": next_marker,
         }
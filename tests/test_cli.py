@@ -0,0 +1,168 @@
+"""Tests for the top-level CLI group."""
+
+import io
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from pys3local.cli import _emit, cli, main
+
+
+def test_help_lists_lazy_commands():
+    """Test that lazily loaded subcommands show up in --help."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ("serve", "obscure", "config", "cache"):
+        assert name in result.output
+
+
+def test_subcommand_import_is_lazy():
+    """Test that dispatching one subcommand does not import the others."""
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from pys3local.cli import cli\n"
+        "CliRunner().invoke(cli, ['obscure', '--help'])\n"
+        "print('pys3local.cli._serve' in sys.modules, 'uvicorn' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False False"
+
+
+def test_unknown_command():
+    """Test that unknown subcommands are still rejected."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["nonexistent"])
+
+    assert result.exit_code != 0
+    assert "No such command" in result.output
+
+
+def test_main_version_fast_path(monkeypatch, capsys):
+    """Test that main() answers --version without invoking the Click group."""
+    monkeypatch.setattr(sys, "argv", ["pys3local", "--version"])
+    monkeypatch.setattr("pys3local.cli.cli", None)  # Would fail if called
+
+    main()
+
+    assert capsys.readouterr().out.startswith("pys3local, version ")
+
+
+def test_emit_strips_markup_when_not_a_tty(capsys):
+    """Test that piped output has Rich markup removed but keeps literals."""
+    _emit("[green]Authentication enabled[/green]")
+    _emit("[bold cyan]Title[/bold cyan]")
+    _emit("\\[pys3local]")
+
+    assert capsys.readouterr().out.splitlines() == [
+        "Authentication enabled",
+        "Title",
+        "[pys3local]",
+    ]
+
+
+def test_emit_flushes_piped_output(monkeypatch):
+    """Test that piped lines are flushed instead of held in the buffer."""
+
+    class Pipe(io.StringIO):
+        flushed = ""
+
+        def flush(self):
+            self.flushed = self.getvalue()
+
+    pipe = Pipe()
+    monkeypatch.setattr(sys, "stdout", pipe)
+
+    _emit("Endpoint: http://localhost:10001")
+
+    assert pipe.flushed == "Endpoint: http://localhost:10001\n"
+
+
+def test_config_menu_dispatch():
+    """Test that config menu choices dispatch to their actions."""
+    config_manager = MagicMock()
+    config_manager.list_backends.return_value = ["mydrime"]
+    backend = config_manager.get_backend.return_value
+    backend.backend_type = "drime"
+    backend.get_all.return_value = {"api_key": "secret", "workspace_id": 0}
+
+    runner = CliRunner()
+    with patch("pys3local.config.get_config_manager", return_value=config_manager):
+        result = runner.invoke(cli, ["config"], input="1\n3\nmydrime\n9\n5\n")
+
+    assert result.exit_code == 0
+    assert "mydrime (drime)" in result.output
+    assert "api_key: <hidden>" in result.output
+    assert "secret" not in result.output
+    assert "Exiting configuration manager." in result.output
+
+
+def test_obscure_rejects_empty_password():
+    """Test that an empty password is rejected."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["obscure", ""])
+
+    assert result.exit_code == 1
+    assert "Password cannot be empty" in result.output
+
+
+def test_obscure_password():
+    """Test obscuring a password given on the command line."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["obscure", "secret"])
+
+    assert result.exit_code == 0
+    assert "Obscured password:" in result.output
+    assert "secret" not in result.output
+
+
+def test_select_uvicorn_backends_falls_back(monkeypatch):
+    """Test that asyncio and h11 are used without uvloop and httptools."""
+    import importlib.util
+
+    from pys3local.cli._serve import _select_uvicorn_backends
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+
+    assert _select_uvicorn_backends() == ("asyncio", "h11")
+
+
+@pytest.mark.parametrize(
+    ("listen", "expected"),
+    [
+        (":8080", ("0.0.0.0", 8080)),
+        ("127.0.0.1:9000", ("127.0.0.1", 9000)),
+        ("[::1]:9000", ("[::1]", 9000)),
+        ("localhost", ("localhost", 10001)),
+    ],
+)
+def test_parse_listen(listen, expected):
+    """Test splitting --listen values into host and port."""
+    from pys3local.cli._serve import _parse_listen
+
+    assert _parse_listen(listen) == expected
+
+
+def test_cached_drime_client_reused_per_api_key(monkeypatch):
+    """Test that one Drime client is built per API key."""
+    from pys3local.cli import _serve
+
+    client_class = MagicMock(side_effect=lambda api_key: object())
+    monkeypatch.setattr(_serve, "_load_drime", lambda: (client_class, None))
+    _serve._cached_drime_client.cache_clear()
+    try:
+        first = _serve._cached_drime_client("key-1")
+
+        assert _serve._cached_drime_client("key-1") is first
+        assert _serve._cached_drime_client("key-2") is not first
+        assert client_class.call_count == 2
+    finally:
+        _serve._cached_drime_client.cache_clear()
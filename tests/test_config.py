@@ -0,0 +1,65 @@
+"""Tests for backend configuration management."""
+
+import pytest
+
+from pys3local.config import Pys3localConfigManager
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """Create a config manager using a temporary config directory."""
+    return Pys3localConfigManager(config_file=tmp_path / "backends.toml")
+
+
+def test_add_and_get_backend(config_manager):
+    """Test adding a backend and reading it back with secrets revealed."""
+    config_manager.add_backend("mydrime", "drime", {"api_key": "secret"})
+
+    backend = config_manager.get_backend("mydrime")
+
+    assert backend is not None
+    assert backend.backend_type == "drime"
+    assert backend.get("api_key") == "secret"
+    assert config_manager.list_backends() == ["mydrime"]
+
+
+def test_get_backend_is_cached(config_manager):
+    """Test that repeated lookups reuse the parsed backend config."""
+    config_manager.add_backend("local1", "local", {"path": "/data"})
+
+    assert config_manager.get_backend("local1") is config_manager.get_backend("local1")
+    assert config_manager.get_backend("missing") is None
+
+
+def test_remove_backend_invalidates_cache(config_manager):
+    """Test that removing a backend drops its cached config."""
+    config_manager.add_backend("local1", "local", {"path": "/data"})
+    assert config_manager.get_backend("local1") is not None
+
+    assert config_manager.remove_backend("local1") is True
+
+    assert config_manager.get_backend("local1") is None
+    assert config_manager.has_backend("local1") is False
+
+
+def test_reload_after_external_change(tmp_path, config_manager):
+    """Test that config files added by another process are picked up."""
+    assert config_manager.list_backends() == []
+
+    other = Pys3localConfigManager(config_file=tmp_path / "backends.toml")
+    other.add_backend("external", "local", {"path": "/other"})
+
+    backend = config_manager.get_backend("external")
+    assert backend is not None
+    assert backend.get("path") == "/other"
+
+
+def test_reload_after_in_place_edit(tmp_path, config_manager):
+    """Test that a backend file edited in place is picked up."""
+    config_manager.add_backend("local1", "local", {"path": "/data"})
+    assert config_manager.get_backend("local1").get("path") == "/data"
+
+    other = Pys3localConfigManager(config_file=tmp_path / "backends.toml")
+    other.add_backend("local1", "local", {"path": "/changed/data"})
+
+    assert config_manager.get_backend("local1").get("path") == "/changed/data"
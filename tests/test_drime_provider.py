@@ -4,14 +4,20 @@ Note: These tests use mocks since they don't require actual Drime API credential
 For integration tests with real API, run benchmarks/drime_s3_benchmark.py
 """
 
+import time
 from datetime import datetime
 from typing import Optional
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
+from pydrime.exceptions import DrimeNotFoundError, DrimePermissionError
 
 from pys3local.errors import BucketAlreadyExists, NoSuchBucket, NoSuchKey
-from pys3local.providers.drime import DrimeStorageProvider
+from pys3local.providers.drime import (
+    _CACHE_STALE_FACTOR,
+    DrimeStorageProvider,
+    _LRUCache,
+)
 
 
 @pytest.fixture
@@ -50,6 +56,24 @@ def mock_file_entry():
     return _create_entry
 
 
+@pytest.fixture
+def drime_listings(mock_drime_client):
+    """Serve Drime folder listings from a dict of parent ID -> entries.
+
+    Tests fill the returned dict; each get_file_entries call is answered
+    with the entries of the requested parent folder (None for the root).
+    """
+    listings: dict = {}
+    mock_drime_client.get_file_entries.side_effect = lambda **params: {
+        "parent": (params.get("parent_ids") or [None])[0] or None
+    }
+    with patch("pydrime.models.FileEntriesResult.from_api_response") as from_api:
+        from_api.side_effect = lambda response: Mock(
+            entries=listings.get(response["parent"], []), pagination=None
+        )
+        yield listings
+
+
 @pytest.fixture
 def drime_provider(mock_drime_client):
     """Create a Drime storage provider with mock client."""
@@ -116,20 +140,53 @@ def test_create_bucket_already_exists(
     drime_provider, mock_drime_client, mock_file_entry
 ):
     """Test creating a bucket that already exists."""
-    # Mock that folder already exists
+    # Drime rejects creating a folder that already exists
+    mock_drime_client.create_folder.side_effect = Exception("422 Unprocessable Entity")
+
+    with pytest.raises(BucketAlreadyExists):
+        drime_provider.create_bucket("test-bucket")
+
+    # No separate existence check is made
+    mock_drime_client.get_file_entries.assert_not_called()
+
+
+def test_list_buckets_scopes_root_listing(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that buckets come from one root-level listing, reused while fresh."""
+    drime_listings[None] = [mock_file_entry("bucket1", is_folder=True, entry_id=1)]
+
+    assert [b.name for b in drime_provider.list_buckets()] == ["bucket1"]
+    assert [b.name for b in drime_provider.list_buckets()] == ["bucket1"]
+
+    mock_drime_client.get_file_entries.assert_called_once()
+    assert mock_drime_client.get_file_entries.call_args.kwargs["parent_ids"] == [0]
+
+
+def test_list_buckets_caches_bucket_ids(
+    drime_provider, mock_drime_client, mock_file_entry
+):
+    """Test that listed buckets are answered from cache afterwards."""
     mock_entries_result = Mock()
     mock_entries_result.entries = [
         mock_file_entry("test-bucket", is_folder=True, entry_id=1)
     ]
+    mock_entries_result.pagination = None
     mock_drime_client.get_file_entries.return_value = {"data": []}
 
     with patch(
         "pydrime.models.FileEntriesResult.from_api_response",
         return_value=mock_entries_result,
     ):
+        drime_provider.list_buckets()
+        assert drime_provider.bucket_exists("test-bucket") is True
+        assert drime_provider.bucket_exists("nonexistent") is False
         with pytest.raises(BucketAlreadyExists):
             drime_provider.create_bucket("test-bucket")
 
+    assert mock_drime_client.get_file_entries.call_count == 1
+    mock_drime_client.create_folder.assert_not_called()
+
 
 def test_bucket_exists(drime_provider, mock_drime_client, mock_file_entry):
     """Test checking if bucket exists."""
@@ -224,6 +281,102 @@ def test_folder_id_caching(drime_provider, mock_drime_client, mock_file_entry):
         assert call_count[0] == 0
 
 
+def test_folder_miss_caching(drime_provider, mock_drime_client):
+    """Test that missing folders are cached so lookups are not repeated."""
+    mock_empty_result = Mock()
+    mock_empty_result.entries = []
+    mock_drime_client.get_file_entries.return_value = {"data": []}
+
+    with patch(
+        "pydrime.models.FileEntriesResult.from_api_response",
+        return_value=mock_empty_result,
+    ):
+        assert drime_provider._get_folder_id_by_path("missing/sub") is None
+        assert mock_drime_client.get_file_entries.call_count == 1
+
+        # Both the missing prefix and the full path are served from cache
+        assert drime_provider._get_folder_id_by_path("missing/sub") is None
+        assert drime_provider._get_folder_id_by_path("missing/other") is None
+        assert mock_drime_client.get_file_entries.call_count == 1
+
+
+def test_folder_cache_expires(drime_provider, mock_drime_client, mock_file_entry):
+    """Test that long expired folder lookups are fetched again."""
+    mock_bucket_result = Mock()
+    mock_bucket_result.entries = [
+        mock_file_entry("bucket", is_folder=True, entry_id=100)
+    ]
+    mock_drime_client.get_file_entries.return_value = {"data": []}
+    max_age = drime_provider._cache_ttl * _CACHE_STALE_FACTOR + 1
+
+    with patch(
+        "pydrime.models.FileEntriesResult.from_api_response",
+        return_value=mock_bucket_result,
+    ):
+        assert drime_provider._get_folder_id_by_path("bucket") == 100
+
+        # Age the cached lookup and root listing past the stale limit
+        folder_id, fetched_at, _ = drime_provider._folder_cache["bucket"]
+        drime_provider._folder_cache["bucket"] = (
+            folder_id,
+            fetched_at - max_age,
+            False,
+        )
+        fetched_at, folders, files = drime_provider._dir_index[None]
+        drime_provider._dir_index[None] = (fetched_at - max_age, folders, files)
+        assert drime_provider._get_folder_id_by_path("bucket") == 100
+
+    assert mock_drime_client.get_file_entries.call_count == 2
+    assert drime_provider._refresher is None
+
+
+def test_stale_folder_lookup_refreshed_in_background(
+    drime_provider, mock_drime_client, mock_file_entry
+):
+    """Test that a stale folder lookup is served while it is refreshed."""
+    mock_bucket_result = Mock()
+    mock_bucket_result.entries = [
+        mock_file_entry("bucket", is_folder=True, entry_id=200)
+    ]
+    mock_bucket_result.pagination = None
+    mock_drime_client.get_file_entries.return_value = {"data": []}
+    drime_provider._folder_cache["bucket"] = (
+        100,
+        time.monotonic() - drime_provider._cache_ttl - 1,
+        False,
+    )
+
+    with patch(
+        "pydrime.models.FileEntriesResult.from_api_response",
+        return_value=mock_bucket_result,
+    ):
+        # The stale ID is returned immediately
+        assert drime_provider._get_folder_id_by_path("bucket") == 100
+        drime_provider._refresher.shutdown(wait=True)
+
+    assert drime_provider._folder_cache["bucket"][0] == 200
+    assert drime_provider._folder_cache["bucket"][2] is False
+
+    drime_provider.close()
+    assert drime_provider._refresher is None
+
+
+def test_create_bucket_clears_cached_miss(drime_provider, mock_drime_client):
+    """Test that creating a bucket forgets a cached "missing" lookup."""
+    mock_empty_result = Mock()
+    mock_empty_result.entries = []
+    mock_drime_client.get_file_entries.return_value = {"data": []}
+
+    with patch(
+        "pydrime.models.FileEntriesResult.from_api_response",
+        return_value=mock_empty_result,
+    ):
+        assert drime_provider._get_folder_id_by_path("new-bucket") is None
+        drime_provider.create_bucket("new-bucket")
+
+    assert "new-bucket" not in drime_provider._folder_cache
+
+
 def test_parse_datetime_with_string(drime_provider):
     """Test datetime parsing from ISO string."""
     dt = drime_provider._parse_datetime("2025-01-15T10:30:00Z")
@@ -231,6 +384,39 @@ def test_parse_datetime_with_string(drime_provider):
     assert dt.tzinfo is None  # Should return naive UTC datetime
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-01-15T10:30:00Z",
+        "2025-01-15T10:30:00.000000Z",
+        "2025-01-15T12:30:00+02:00",
+        "2025-01-15T10:30:00",
+    ],
+)
+def test_parse_datetime_normalizes_to_utc(drime_provider, value):
+    """Test that ISO strings are converted to naive UTC, not local time."""
+    assert drime_provider._parse_datetime(value) == datetime(2025, 1, 15, 10, 30)
+
+
+def test_parse_datetime_memoizes_strings(drime_provider):
+    """Test that repeated timestamp strings are parsed only once."""
+    from pys3local.providers.drime import _parse_iso_cached
+
+    _parse_iso_cached.cache_clear()
+    for _ in range(3):
+        drime_provider._parse_datetime("2025-01-15T10:30:00Z")
+
+    info = _parse_iso_cached.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_parse_datetime_invalid_string_uses_now(drime_provider):
+    """Test that an unparseable timestamp falls back to the given time."""
+    now = datetime(2024, 6, 1, 12, 0)
+    assert drime_provider._parse_datetime("not a timestamp", now) == now
+
+
 def test_parse_datetime_with_datetime(drime_provider):
     """Test datetime parsing from datetime object."""
     from datetime import timezone
@@ -241,6 +427,20 @@ def test_parse_datetime_with_datetime(drime_provider):
     assert dt.tzinfo is None  # Should return naive UTC datetime
 
 
+@pytest.mark.parametrize(
+    ("bucket", "key", "expected"),
+    [
+        ("bucket", "file.txt", ("bucket", "file.txt")),
+        ("bucket", "a/b/file.txt", ("bucket/a/b", "file.txt")),
+        ("", "file.txt", ("", "file.txt")),
+        ("", "a/file.txt", ("a", "file.txt")),
+    ],
+)
+def test_split_key(drime_provider, bucket, key, expected):
+    """Test splitting object keys into folder path and file name."""
+    assert drime_provider._split_key(bucket, key) == expected
+
+
 def test_parse_datetime_with_none(drime_provider):
     """Test datetime parsing with None."""
     dt = drime_provider._parse_datetime(None)
@@ -364,6 +564,39 @@ def test_put_object_simple(drime_provider, mock_drime_client, mock_file_entry):
     mock_drime_client.upload_file_simple.assert_called_once()
 
 
+def test_put_object_stages_data_in_private_file(
+    drime_provider, mock_drime_client, mock_file_entry
+):
+    """Test that uploads stage data in a uniquely named temp dir."""
+    mock_bucket_result = Mock()
+    mock_bucket_result.entries = [
+        mock_file_entry("bucket", is_folder=True, entry_id=100)
+    ]
+    mock_drime_client.get_file_entries.return_value = {"data": []}
+
+    uploaded = {}
+
+    def mock_upload(file_path, **kwargs):
+        uploaded["path"] = file_path
+        uploaded["data"] = file_path.read_bytes()
+        return {"fileEntry": {"file_name": "uuid-1"}}
+
+    mock_drime_client.upload_file_simple.side_effect = mock_upload
+
+    with patch(
+        "pydrime.models.FileEntriesResult.from_api_response",
+        return_value=mock_bucket_result,
+    ):
+        result = drime_provider.put_object("bucket", "file.txt", b"hello world")
+
+    assert result.etag == "uuid-1"
+    assert uploaded["path"].name == "file.txt"
+    assert uploaded["data"] == b"hello world"
+    # The staged file and its directory are removed after the upload
+    assert not uploaded["path"].exists()
+    assert not uploaded["path"].parent.exists()
+
+
 def test_put_object_nested_path(drime_provider, mock_drime_client, mock_file_entry):
     """Test uploading object with nested path (creates folders)."""
     # Mock bucket exists
@@ -554,65 +787,278 @@ def test_delete_object(drime_provider, mock_drime_client, mock_file_entry):
     mock_drime_client.delete_file_entries.assert_called_once()
 
 
-def test_copy_object(drime_provider, mock_drime_client, mock_file_entry):
-    """Test copying an object."""
-    # Mock source bucket and file exist
-    mock_bucket_result = Mock()
-    mock_bucket_result.entries = [
-        mock_file_entry("bucket", is_folder=True, entry_id=100)
-    ]
+def test_delete_object_keeps_sibling_entries_indexed(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that deleting one file does not drop its folder's listing."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [
+                mock_file_entry("a.txt", entry_id=1, parent_id=100),
+                mock_file_entry("b.txt", entry_id=2, parent_id=100),
+            ],
+        }
+    )
 
-    mock_file_result = Mock()
-    mock_file_result.entries = [
-        mock_file_entry(
-            "source.txt",
-            is_folder=False,
-            entry_id=123,
-            parent_id=100,
-            file_size=11,
-            file_hash="abc123",
-        )
-    ]
+    drime_provider.delete_object("bucket", "a.txt")
+    calls = mock_drime_client.get_file_entries.call_count
 
-    # Mock destination bucket exists
-    mock_dest_bucket_result = Mock()
-    mock_dest_bucket_result.entries = [
-        mock_file_entry("dest-bucket", is_folder=True, entry_id=200)
-    ]
+    assert drime_provider.object_exists("bucket", "b.txt")
+    assert not drime_provider.object_exists("bucket", "a.txt")
+    assert mock_drime_client.get_file_entries.call_count == calls
 
-    call_count = [0]
 
-    def mock_from_api(response):
-        call_count[0] += 1
-        if call_count[0] == 1:
-            return mock_bucket_result  # Source bucket
-        elif call_count[0] == 2:
-            return mock_file_result  # Source file
-        else:
-            return mock_dest_bucket_result  # Dest bucket
+def test_delete_objects_batches_api_calls(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that deleting many objects uses one listing per folder."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [
+                mock_file_entry("a.txt", entry_id=1, parent_id=100),
+                mock_file_entry("b.txt", entry_id=2, parent_id=100),
+            ],
+        }
+    )
 
-    mock_drime_client.get_file_entries.return_value = {"data": []}
+    result = drime_provider.delete_objects("bucket", ["a.txt", "b.txt", "c.txt"])
+
+    assert result["deleted"] == ["a.txt", "b.txt"]
+    assert [e["key"] for e in result["errors"]] == ["c.txt"]
+    assert result["errors"][0]["code"] == "NoSuchKey"
+    assert mock_drime_client.get_file_entries.call_count == 2
+    mock_drime_client.delete_file_entries.assert_called_once_with(
+        [1, 2], workspace_id=0
+    )
+
+
+def test_delete_objects_falls_back_to_single_deletes(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that a failed batch delete is retried entry by entry."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [
+                mock_file_entry("a.txt", entry_id=1, parent_id=100),
+                mock_file_entry("b.txt", entry_id=2, parent_id=100),
+                mock_file_entry("c.txt", entry_id=3, parent_id=100),
+            ],
+        }
+    )
+
+    def mock_delete(entry_ids, **kwargs):
+        if 2 in entry_ids:
+            raise Exception("500 Server Error")
+
+    mock_drime_client.delete_file_entries.side_effect = mock_delete
+
+    result = drime_provider.delete_objects("bucket", ["a.txt", "b.txt", "c.txt"])
+
+    assert result["deleted"] == ["a.txt", "c.txt"]
+    assert result["errors"] == [
+        {"key": "b.txt", "code": "InternalError", "message": "500 Server Error"}
+    ]
+    # One batched call, then one call per entry
+    assert mock_drime_client.delete_file_entries.call_count == 4
+
+
+def test_copy_object(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test copying an object by download and upload without server copies."""
+    drime_listings.update(
+        {
+            None: [
+                mock_file_entry("bucket", is_folder=True, entry_id=100),
+                mock_file_entry("dest-bucket", is_folder=True, entry_id=200),
+            ],
+            100: [
+                mock_file_entry(
+                    "source.txt",
+                    entry_id=123,
+                    parent_id=100,
+                    file_size=11,
+                    file_hash="abc123",
+                )
+            ],
+        }
+    )
+    # The API rejects the duplicate call, so the content is re-uploaded
+    mock_drime_client.duplicate_file_entries.side_effect = Exception(
+        "405 Method Not Allowed"
+    )
     mock_drime_client.get_file_content.return_value = b"hello world"
-    # Copy uses upload_file_simple for simple file names
     mock_drime_client.upload_file_simple.return_value = {
         "id": 456,
         "name": "dest.txt",
         "file_size": 11,
     }
 
-    with patch(
-        "pydrime.models.FileEntriesResult.from_api_response",
-        side_effect=mock_from_api,
-    ):
-        result = drime_provider.copy_object(
-            "bucket", "source.txt", "dest-bucket", "dest.txt"
-        )
+    result = drime_provider.copy_object(
+        "bucket", "source.txt", "dest-bucket", "dest.txt"
+    )
 
     assert result.key == "dest.txt"
     assert result.size == 11
     mock_drime_client.get_file_content.assert_called_once_with("abc123")
     mock_drime_client.upload_file_simple.assert_called_once()
 
+    # Later copies no longer try the server-side copy
+    assert drime_provider._supports_server_copy is False
+    drime_provider.copy_object("bucket", "source.txt", "dest-bucket", "dest.txt")
+    mock_drime_client.duplicate_file_entries.assert_called_once()
+
+
+def test_copy_object_server_side_error_is_raised(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that other server-side copy errors are not retried by upload."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [mock_file_entry("source.txt", entry_id=123, parent_id=100)],
+        }
+    )
+    mock_drime_client.duplicate_file_entries.side_effect = Exception(
+        "500 Internal Server Error"
+    )
+
+    with pytest.raises(Exception, match="500"):
+        drime_provider.copy_object("bucket", "source.txt", "bucket", "dest.txt")
+
+    assert drime_provider._supports_server_copy is True
+    mock_drime_client.upload_file_simple.assert_not_called()
+
+
+def test_copy_object_server_side(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test copying an object with Drime's duplicate endpoint."""
+    drime_listings.update(
+        {
+            None: [
+                mock_file_entry("bucket", is_folder=True, entry_id=100),
+                mock_file_entry("dest-bucket", is_folder=True, entry_id=200),
+            ],
+            100: [mock_file_entry("source.txt", entry_id=123, parent_id=100)],
+            200: [mock_file_entry("dest.txt", entry_id=150, parent_id=200)],
+        }
+    )
+
+    def mock_rename(entry_id, new_name, **kwargs):
+        drime_listings[200] = [
+            mock_file_entry(new_name, entry_id=entry_id, parent_id=200, file_size=11)
+        ]
+
+    mock_drime_client.duplicate_file_entries.return_value = {
+        "status": "success",
+        "entries": [{"id": 456, "name": "source.txt"}],
+    }
+    mock_drime_client.rename_file_entry.side_effect = mock_rename
+
+    result = drime_provider.copy_object(
+        "bucket", "source.txt", "dest-bucket", "dest.txt"
+    )
+
+    assert result.key == "dest.txt"
+    assert result.size == 11
+    mock_drime_client.duplicate_file_entries.assert_called_once_with(
+        [123], destination_id=200, workspace_id=0
+    )
+    # The old destination is moved aside, the copy takes over its name and
+    # only then is the old destination deleted
+    writes = {"rename_file_entry", "delete_file_entries"}
+    assert [c for c in mock_drime_client.mock_calls if c[0] in writes] == [
+        call.rename_file_entry(150, ".dest.txt.456.replaced", workspace_id=0),
+        call.rename_file_entry(456, "dest.txt", workspace_id=0),
+        call.delete_file_entries([150], workspace_id=0),
+    ]
+    mock_drime_client.get_file_content.assert_not_called()
+
+
+def test_copy_object_server_side_failed_rename_keeps_destination(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that a failed rename removes the duplicate, not the destination."""
+    drime_listings.update(
+        {
+            None: [
+                mock_file_entry("bucket", is_folder=True, entry_id=100),
+                mock_file_entry("dest-bucket", is_folder=True, entry_id=200),
+            ],
+            100: [mock_file_entry("source.txt", entry_id=123, parent_id=100)],
+            200: [mock_file_entry("dest.txt", entry_id=150, parent_id=200)],
+        }
+    )
+    mock_drime_client.duplicate_file_entries.return_value = {
+        "entries": [{"id": 456, "name": "source.txt"}],
+    }
+    mock_drime_client.rename_file_entry.side_effect = Exception("500 Server Error")
+
+    with pytest.raises(Exception, match="500"):
+        drime_provider.copy_object("bucket", "source.txt", "dest-bucket", "dest.txt")
+
+    mock_drime_client.delete_file_entries.assert_called_once_with([456], workspace_id=0)
+
+
+def test_copy_object_server_side_failed_rename_restores_destination(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that the moved-aside destination gets its name back on failure."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [
+                mock_file_entry("source.txt", entry_id=123, parent_id=100),
+                mock_file_entry("dest.txt", entry_id=150, parent_id=100),
+            ],
+        }
+    )
+    mock_drime_client.duplicate_file_entries.return_value = {
+        "entries": [{"id": 456, "name": "source (1).txt"}],
+    }
+    mock_drime_client.rename_file_entry.side_effect = [
+        None,
+        Exception("500 Server Error"),
+        None,
+    ]
+
+    with pytest.raises(Exception, match="500"):
+        drime_provider.copy_object("bucket", "source.txt", "bucket", "dest.txt")
+
+    mock_drime_client.delete_file_entries.assert_called_once_with([456], workspace_id=0)
+    assert mock_drime_client.rename_file_entry.call_args == call(
+        150, "dest.txt", workspace_id=0
+    )
+
+
+def test_copy_object_missing_source_keeps_server_copy(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that a 404 for a vanished source does not disable server copies."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [mock_file_entry("source.txt", entry_id=123, parent_id=100)],
+        }
+    )
+
+    def mock_duplicate(*args, **kwargs):
+        # The source is deleted by someone else before it can be copied
+        drime_listings[100] = []
+        raise DrimeNotFoundError("Resource not found")
+
+    mock_drime_client.duplicate_file_entries.side_effect = mock_duplicate
+
+    with pytest.raises(DrimeNotFoundError):
+        drime_provider.copy_object("bucket", "source.txt", "bucket", "dest.txt")
+
+    assert drime_provider._supports_server_copy is True
+    mock_drime_client.get_file_content.assert_not_called()
+
 
 def test_object_exists(drime_provider, mock_drime_client, mock_file_entry):
     """Test checking if object exists."""
@@ -646,3 +1092,413 @@ def test_object_exists(drime_provider, mock_drime_client, mock_file_entry):
         # Reset for next check
         call_count[0] = 0
         assert drime_provider.object_exists("bucket", "nonexistent.txt") is False
+
+
+def test_head_object_uses_metadata_cache(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that repeated HEADs and existence checks skip the API."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [
+                mock_file_entry("file.txt", entry_id=123, parent_id=100, file_size=5)
+            ],
+        }
+    )
+
+    first = drime_provider.head_object("bucket", "file.txt")
+    assert drime_provider.head_object("bucket", "file.txt") is first
+    assert drime_provider.object_exists("bucket", "file.txt") is True
+    assert drime_provider.object_exists("bucket", "other.txt") is False
+    assert mock_drime_client.get_file_entries.call_count == 2
+
+    # Deleting the object drops its cached metadata
+    drime_provider.delete_object("bucket", "file.txt")
+    assert ("bucket", "file.txt") not in drime_provider._object_meta_cache
+
+
+def test_file_lookups_share_directory_listing(
+    drime_provider, mock_drime_client, mock_file_entry
+):
+    """Test that lookups in one folder reuse its indexed listing."""
+    mock_result = Mock()
+    mock_result.entries = [
+        mock_file_entry("a.txt", entry_id=1, parent_id=100),
+        mock_file_entry("b.txt", entry_id=2, parent_id=100),
+        mock_file_entry("sub", is_folder=True, entry_id=3, parent_id=100),
+    ]
+    mock_drime_client.get_file_entries.return_value = {"data": []}
+
+    with patch(
+        "pydrime.models.FileEntriesResult.from_api_response",
+        return_value=mock_result,
+    ):
+        assert drime_provider._get_file_entry(100, "a.txt").id == 1
+        assert drime_provider._get_file_entry(100, "b.txt").id == 2
+        assert drime_provider._get_file_entry(100, "sub") is None
+        assert mock_drime_client.get_file_entries.call_count == 1
+
+        # A change to the folder forces a fresh listing
+        drime_provider._invalidate_dir(100)
+        assert drime_provider._get_file_entry(100, "a.txt").id == 1
+        assert mock_drime_client.get_file_entries.call_count == 2
+
+
+def test_resolve_paths_many(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test resolving several folder paths with one listing per folder."""
+    drime_listings.update(
+        {
+            None: [
+                mock_file_entry("bucket", is_folder=True, entry_id=100),
+                mock_file_entry("other", is_folder=True, entry_id=300),
+            ],
+            100: [
+                mock_file_entry("a", is_folder=True, entry_id=101, parent_id=100),
+                mock_file_entry("b", is_folder=True, entry_id=102, parent_id=100),
+            ],
+            300: [mock_file_entry("x.txt", entry_id=301, parent_id=300)],
+        }
+    )
+
+    result = drime_provider._resolve_paths_many(
+        ["bucket/a", "bucket/b", "other/x.txt", "missing/c", ""]
+    )
+
+    assert result == {
+        "bucket/a": 101,
+        "bucket/b": 102,
+        "other/x.txt": None,
+        "missing/c": None,
+        "": None,
+    }
+    # Root, bucket and other are each listed exactly once
+    assert mock_drime_client.get_file_entries.call_count == 3
+    assert drime_provider._folder_cache["bucket"][0] == 100
+
+
+def test_resolve_path_from_cached_prefix(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that path lookups continue below the longest cached prefix."""
+    drime_listings.update(
+        {
+            101: [mock_file_entry("cc", is_folder=True, entry_id=102, parent_id=101)],
+            102: [mock_file_entry("d", is_folder=True, entry_id=103, parent_id=102)],
+        }
+    )
+    drime_provider._folder_cache_put("bucket/aa", 101)
+
+    assert drime_provider._get_folder_id_by_path("bucket/aa/cc/d") == 103
+    assert drime_provider._folder_cache["bucket/aa/cc"][0] == 102
+    assert drime_provider._resolve_paths_many(["bucket/aa/cc/e"]) == {
+        "bucket/aa/cc/e": None
+    }
+    assert drime_provider._folder_cache["bucket/aa/cc/e"][0] is None
+    # Only the folders below the cached prefix are listed
+    assert mock_drime_client.get_file_entries.call_count == 2
+
+
+def test_listing_follows_all_pages(drime_provider, mock_drime_client, mock_file_entry):
+    """Test that folder listings are not cut off after the first page."""
+    pages = {
+        1: [mock_file_entry("a.txt", entry_id=1, parent_id=100)],
+        2: [mock_file_entry("b.txt", entry_id=2, parent_id=100)],
+    }
+
+    def mock_get_entries(**params):
+        return {"page": params["page"]}
+
+    def mock_from_api(response):
+        result = Mock()
+        result.entries = pages[response["page"]]
+        result.pagination = {"current_page": response["page"], "last_page": 2}
+        return result
+
+    mock_drime_client.get_file_entries.side_effect = mock_get_entries
+
+    with patch(
+        "pydrime.models.FileEntriesResult.from_api_response",
+        side_effect=mock_from_api,
+    ):
+        assert sorted(drime_provider._list_files(100)) == ["a.txt", "b.txt"]
+
+    assert mock_drime_client.get_file_entries.call_count == 2
+
+
+def test_listing_without_page_info_stops_at_short_page(
+    drime_provider, mock_drime_client, mock_file_entry
+):
+    """Test that full pages are followed when pagination is not reported."""
+    pages = {
+        1: [mock_file_entry("a.txt", entry_id=1), mock_file_entry("b.txt")],
+        2: [mock_file_entry("c.txt", entry_id=3)],
+    }
+    mock_drime_client.get_file_entries.side_effect = lambda **kw: {"page": kw["page"]}
+
+    with patch("pydrime.models.FileEntriesResult.from_api_response") as from_api:
+        from_api.side_effect = lambda resp: Mock(
+            entries=pages[resp["page"]], pagination=None
+        )
+        entries = list(drime_provider._iter_file_entries(per_page=2))
+
+    assert [e.name for e in entries] == ["a.txt", "b.txt", "c.txt"]
+    assert mock_drime_client.get_file_entries.call_count == 2
+
+
+def test_list_objects_with_delimiter(drime_provider, mock_file_entry, drime_listings):
+    """Test listing one folder level with a prefix, delimiter and max_keys."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [mock_file_entry("dir", is_folder=True, entry_id=101, parent_id=100)],
+            101: [
+                mock_file_entry("b.txt", entry_id=2, parent_id=101),
+                mock_file_entry("a.txt", entry_id=1, parent_id=101),
+                mock_file_entry("sub", is_folder=True, entry_id=102, parent_id=101),
+            ],
+        }
+    )
+
+    result = drime_provider.list_objects("bucket", prefix="dir/", delimiter="/")
+    assert [obj.key for obj in result["contents"]] == ["dir/a.txt", "dir/b.txt"]
+    assert result["common_prefixes"] == ["dir/sub/"]
+    assert result["is_truncated"] is False
+
+    # Common prefixes count against max_keys and honour the marker
+    result = drime_provider.list_objects(
+        "bucket", prefix="dir/", delimiter="/", max_keys=2, marker="dir/a.txt"
+    )
+    assert [obj.key for obj in result["contents"]] == ["dir/b.txt"]
+    assert result["common_prefixes"] == ["dir/sub/"]
+    assert result["is_truncated"] is False
+
+    result = drime_provider.list_objects(
+        "bucket", prefix="dir/", delimiter="/", max_keys=1
+    )
+    assert [obj.key for obj in result["contents"]] == ["dir/a.txt"]
+    assert result["common_prefixes"] == []
+    assert result["is_truncated"] is True
+    assert result["next_marker"] == "dir/a.txt"
+
+
+def test_folder_and_file_with_same_name(
+    drime_provider, mock_drime_client, mock_file_entry
+):
+    """Test that a folder and a file sharing a name are both found."""
+    mock_result = Mock()
+    mock_result.entries = [
+        mock_file_entry("data", is_folder=True, entry_id=10, parent_id=100),
+        mock_file_entry("data", entry_id=11, parent_id=100),
+    ]
+    mock_result.pagination = None
+    mock_drime_client.get_file_entries.return_value = {"data": []}
+
+    with patch(
+        "pydrime.models.FileEntriesResult.from_api_response",
+        return_value=mock_result,
+    ):
+        assert drime_provider._list_folders(100)["data"].id == 10
+        assert drime_provider._get_file_entry(100, "data").id == 11
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """Test that the provider caches stay bounded."""
+    cache: _LRUCache[str, int] = _LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1  # "a" is now the most recently used
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    cache.discard_where(lambda key: key == "a")
+    assert list(cache) == ["c"]
+
+
+def test_put_object_updates_directory_index(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that an uploaded file is found without listing its folder again."""
+    drime_listings.update(
+        {None: [mock_file_entry("bucket", is_folder=True, entry_id=100)], 100: []}
+    )
+    mock_drime_client.upload_file_simple.return_value = {
+        "status": "success",
+        "fileEntry": {
+            "id": 5,
+            "name": "file.txt",
+            "type": "text",
+            "file_name": "uuid-5",
+            "file_size": 11,
+            "parent_id": 100,
+            "created_at": "2025-01-01T00:00:00Z",
+        },
+    }
+
+    assert drime_provider.object_exists("bucket", "file.txt") is False
+    calls = mock_drime_client.get_file_entries.call_count
+    drime_provider.put_object("bucket", "file.txt", b"hello world")
+    obj = drime_provider.head_object("bucket", "file.txt")
+
+    assert obj.size == 11
+    assert mock_drime_client.get_file_entries.call_count == calls
+
+
+def test_folder_tree_resolves_deep_path(drime_provider, mock_drime_client):
+    """Test that a nested path is resolved from one folder tree request."""
+    mock_drime_client.get_logged_user.return_value = {"user": {"id": 7}}
+    mock_drime_client.get_user_folders.return_value = {
+        "folders": [
+            {"id": 1, "name": "bucket", "parent_id": None},
+            {"id": 2, "name": "a", "parent_id": 1},
+            {"id": 3, "name": "b", "parent_id": 2},
+        ]
+    }
+
+    assert drime_provider._get_folder_id_by_path("bucket/a/b") == 3
+    assert drime_provider._get_folder_id_by_path("bucket/a") == 2
+
+    mock_drime_client.get_user_folders.assert_called_once_with(7, 0)
+    mock_drime_client.get_file_entries.assert_not_called()
+
+
+def test_folder_tree_unavailable_falls_back(
+    drime_provider, mock_drime_client, mock_file_entry
+):
+    """Test that path lookups list folders when the tree cannot be fetched."""
+    mock_drime_client.get_logged_user.side_effect = DrimePermissionError(
+        "Access forbidden - check your permissions"
+    )
+    mock_drime_client.get_file_entries.return_value = {"parent": None}
+
+    with patch("pydrime.models.FileEntriesResult.from_api_response") as from_api:
+        from_api.return_value = Mock(
+            entries=[mock_file_entry("bucket", is_folder=True, entry_id=5)],
+            pagination=None,
+        )
+        assert drime_provider._get_folder_id_by_path("bucket") == 5
+        drime_provider._invalidate_folder_path("bucket")
+        assert drime_provider._get_folder_id_by_path("bucket") == 5
+
+    # The tree is not requested again once it is known to be unavailable
+    mock_drime_client.get_logged_user.assert_called_once()
+    assert drime_provider._folder_tree == {}
+
+
+def test_folder_tree_transient_error_retries(drime_provider, mock_drime_client):
+    """Test that a transient folder tree failure is retried after the TTL."""
+    mock_drime_client.get_logged_user.return_value = {"user": {"id": 7}}
+    mock_drime_client.get_user_folders.side_effect = [
+        Exception("500 Internal Server Error"),
+        {"folders": [{"id": 1, "name": "bucket", "parent_id": None}]},
+    ]
+
+    assert drime_provider._load_folder_tree() == {}
+    assert drime_provider._folder_tree_supported is True
+
+    drime_provider._folder_tree_at -= drime_provider._cache_ttl + 1
+    assert drime_provider._load_folder_tree() == {(None, "bucket"): 1}
+
+    # The user ID is fetched only once
+    mock_drime_client.get_logged_user.assert_called_once()
+
+
+def test_list_objects_recursive_walks_all_levels(
+    drime_provider, mock_file_entry, drime_listings
+):
+    """Test that a listing without delimiter collects nested objects."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [
+                mock_file_entry("a", is_folder=True, entry_id=101, parent_id=100),
+                mock_file_entry("b", is_folder=True, entry_id=102, parent_id=100),
+                mock_file_entry("top.txt", entry_id=1, parent_id=100),
+            ],
+            101: [
+                mock_file_entry("c", is_folder=True, entry_id=103, parent_id=101),
+                mock_file_entry("a1.txt", entry_id=2, parent_id=101),
+            ],
+            102: [mock_file_entry("b1.txt", entry_id=3, parent_id=102)],
+            103: [mock_file_entry("c1.txt", entry_id=4, parent_id=103)],
+        }
+    )
+
+    result = drime_provider.list_objects("bucket")
+
+    assert [obj.key for obj in result["contents"]] == [
+        "a/a1.txt",
+        "a/c/c1.txt",
+        "b/b1.txt",
+        "top.txt",
+    ]
+
+
+def test_list_objects_custom_delimiter_with_prefix_and_marker(
+    drime_provider, mock_file_entry, drime_listings
+):
+    """Test filtering full keys by prefix, marker and a non-slash delimiter."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [
+                mock_file_entry("log-2024-a.txt", entry_id=1, parent_id=100),
+                mock_file_entry("log-2025-b.txt", entry_id=2, parent_id=100),
+                mock_file_entry("log-a.txt", entry_id=3, parent_id=100),
+                mock_file_entry("log-b.txt", entry_id=4, parent_id=100),
+                mock_file_entry("other.txt", entry_id=5, parent_id=100),
+            ],
+        }
+    )
+
+    result = drime_provider.list_objects(
+        "bucket", prefix="log-", marker="log-2024-a.txt", delimiter="-"
+    )
+
+    assert result["common_prefixes"] == ["log-2025-"]
+    assert [obj.key for obj in result["contents"]] == ["log-a.txt", "log-b.txt"]
+    assert result["is_truncated"] is False
+
+
+def test_existence_checks_cache_misses(
+    drime_provider, mock_drime_client, mock_file_entry, drime_listings
+):
+    """Test that repeated existence checks for missing things stay local."""
+    drime_listings.update(
+        {
+            None: [mock_file_entry("bucket", is_folder=True, entry_id=100)],
+            100: [mock_file_entry("file.txt", entry_id=1, parent_id=100)],
+        }
+    )
+
+    for _ in range(2):
+        assert drime_provider.object_exists("bucket", "file.txt")
+        assert not drime_provider.object_exists("bucket", "missing.txt")
+        assert not drime_provider.object_exists("bucket", "dir/missing.txt")
+        assert not drime_provider.object_exists("nope", "file.txt")
+        assert drime_provider.bucket_exists("bucket")
+        assert not drime_provider.bucket_exists("nope")
+
+    # Only the root and bucket listings were ever fetched
+    assert mock_drime_client.get_file_entries.call_count == 2
+
+
+def test_bucket_lookup_caches_sibling_buckets(
+    drime_provider, mock_drime_client, mock_file_entry
+):
+    """Test that resolving one bucket records the other top-level folders."""
+    mock_drime_client.get_file_entries.return_value = {"parent": None}
+
+    with patch("pydrime.models.FileEntriesResult.from_api_response") as from_api:
+        from_api.return_value = Mock(
+            entries=[
+                mock_file_entry("bucket1", is_folder=True, entry_id=1),
+                mock_file_entry("bucket2", is_folder=True, entry_id=2),
+            ],
+            pagination=None,
+        )
+        assert drime_provider.bucket_exists("bucket1")
+
+    assert drime_provider._folder_cache_get("bucket2") == 2